@@ -1,7 +1,10 @@
 """Configuration management using pydantic-settings."""
 
+import copy
+import functools
 import re
 from pathlib import Path
+from stat import S_ISDIR
 from typing import Any, Literal
 
 import yaml
@@ -23,6 +26,16 @@ _DANGEROUS_CSS_PATTERNS = [
 ]
 
 
+def _require_directory(path: Path, label: str) -> None:
+    """Raise ValueError unless path is an existing directory, using a single stat."""
+    try:
+        mode = path.stat().st_mode
+    except OSError:
+        raise ValueError(f"{label} does not exist: {path}") from None
+    if not S_ISDIR(mode):
+        raise ValueError(f"{label} is not a directory: {path}")
+
+
 class BrandingConfig(BaseSettings):
     """White-label branding configuration.
 
@@ -128,10 +141,7 @@ class SourceConfig(BaseSettings):
     def validate_path(cls, v: Path) -> Path:
         """Ensure path is absolute and exists."""
         path = v.expanduser().resolve()
-        if not path.exists():
-            raise ValueError(f"Documentation path does not exist: {path}")
-        if not path.is_dir():
-            raise ValueError(f"Documentation path is not a directory: {path}")
+        _require_directory(path, "Documentation path")
         return path
 
 
@@ -216,10 +226,7 @@ class ServerConfig(BaseSettings):
         if v is None:
             return None
         path = v.expanduser().resolve()
-        if not path.exists():
-            raise ValueError(f"Documentation root does not exist: {path}")
-        if not path.is_dir():
-            raise ValueError(f"Documentation root is not a directory: {path}")
+        _require_directory(path, "Documentation root")
         return path
 
     @field_validator("openapi_specs", mode="before")
@@ -299,6 +306,26 @@ def _discover_config_file() -> Path | None:
     return None
 
 
+@functools.lru_cache(maxsize=32)
+def _parse_yaml_file(path: str, mtime_ns: int, size: int) -> Any:
+    """Parse a YAML config file, memoized by path and file version.
+
+    The modification time and size are part of the cache key only, so an
+    edited file is parsed again.
+    """
+    with open(path) as f:
+        return yaml.safe_load(f)
+
+
+def _read_yaml_config(path: str, mtime_ns: int, size: int) -> Any:
+    """Return a private copy of the parsed YAML config file.
+
+    The memoized parse is shared between calls, so each caller gets its own
+    deep copy to modify freely.
+    """
+    return copy.deepcopy(_parse_yaml_file(path, mtime_ns, size))
+
+
 def _apply_yaml_config(config: ServerConfig, yaml_data: dict[str, Any]) -> None:
     """Apply YAML config values to an existing ServerConfig.
 
@@ -374,8 +401,8 @@ def load_config() -> ServerConfig:
 
     if config_path and config_path.is_file():
         try:
-            with open(config_path) as f:
-                yaml_data = yaml.safe_load(f)
+            stat = config_path.stat()
+            yaml_data = _read_yaml_config(str(config_path), stat.st_mtime_ns, stat.st_size)
             if yaml_data and isinstance(yaml_data, dict):
                 _apply_yaml_config(config, yaml_data)
         except Exception:
@@ -1,10 +1,15 @@
 """Document and source data models."""
 
+import re
+import sys
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr, field_validator
+
+# Leading frontmatter block: "---" lines opening and closing it, compiled once
+_FRONTMATTER_RE = re.compile(r"---[ \t]*\r?\n.*?^---[ \t]*\r?$", re.DOTALL | re.MULTILINE)
 
 
 class DocumentationSource(BaseModel):
@@ -35,32 +40,93 @@ class Document(BaseModel):
     last_modified: datetime
     size_bytes: int
 
+    # (content, {max_length: excerpt}) pair so a reassigned content invalidates it
+    _excerpts: tuple[str, dict[int, str]] | None = PrivateAttr(default=None)
+    # (relative_path, breadcrumbs) pair so a reassigned path rebuilds them
+    _breadcrumbs: tuple[Path, tuple[str, ...]] | None = PrivateAttr(default=None)
+    # (last_modified, ISO string) pair, invalidated the same way
+    _last_modified_iso: tuple[datetime, str] | None = PrivateAttr(default=None)
+
+    @field_validator("uri", "category")
+    @classmethod
+    def intern_lookup_key(cls, v: str | None) -> str | None:
+        """Intern strings used as dict keys so lookups can compare by identity."""
+        if v is None:
+            return None
+        return sys.intern(v)
+
+    @classmethod
+    def model_construct(cls, _fields_set: set[str] | None = None, **values: Any) -> "Document":
+        """Build a document without validation, still interning its lookup keys."""
+        document = super().model_construct(_fields_set, **values)
+        document._intern_lookup_keys()
+        return document
+
+    def __setstate__(self, state: dict[Any, Any]) -> None:
+        """Restore a pickled document (e.g. from a parse worker), interning its lookup keys."""
+        super().__setstate__(state)
+        self._intern_lookup_keys()
+
+    def _intern_lookup_keys(self) -> None:
+        """Intern uri and category for documents that skipped field validation."""
+        self.__dict__["uri"] = sys.intern(self.uri)
+        if self.category is not None:
+            self.__dict__["category"] = sys.intern(self.category)
+
     @property
-    def breadcrumbs(self) -> list[str]:
-        """Generate breadcrumb path from root to document."""
-        return list(self.relative_path.parts[:-1])
+    def breadcrumbs(self) -> tuple[str, ...]:
+        """Breadcrumb path from root to document, built on first use."""
+        cached = self._breadcrumbs
+        if cached is None or cached[0] is not self.relative_path:
+            cached = (self.relative_path, self.relative_path.parts[:-1])
+            self._breadcrumbs = cached
+        return cached[1]
+
+    @property
+    def last_modified_iso(self) -> str:
+        """ISO 8601 form of last_modified, formatted on first use."""
+        cached = self._last_modified_iso
+        if cached is None or cached[0] is not self.last_modified:
+            cached = (self.last_modified, self.last_modified.isoformat())
+            self._last_modified_iso = cached
+        return cached[1]
 
     def excerpt(self, max_length: int = 200) -> str:
         """Extract first N characters of content, excluding frontmatter.
 
+        Excerpts are memoized per length until the content is reassigned.
+
         Args:
             max_length: Maximum length of excerpt
 
         Returns:
             Content excerpt
         """
-        # Remove frontmatter delimiter if present
-        content = self.content
-        if content.startswith("---"):
-            parts = content.split("---", 2)
-            if len(parts) >= 3:
-                content = parts[2].strip()
+        cached = self._excerpts
+        if cached is None or cached[0] is not self.content:
+            cached = (self.content, {})
+            self._excerpts = cached
+
+        excerpt = cached[1].get(max_length)
+        if excerpt is None:
+            excerpt = _build_excerpt(self.content, max_length)
+            cached[1][max_length] = excerpt
+        return excerpt
+
+
+def _build_excerpt(content: str, max_length: int) -> str:
+    """Return the first paragraph of content after any frontmatter, truncated to max_length."""
+    # Remove frontmatter if present; "---" inside a value does not close it
+    if content.startswith("---"):
+        frontmatter = _FRONTMATTER_RE.match(content)
+        if frontmatter:
+            content = content[frontmatter.end() :].strip()
 
-        # Get first paragraph or max_length chars
-        paragraphs = content.split("\n\n")
-        excerpt = paragraphs[0] if paragraphs else content
+    # Get first paragraph or max_length chars, without splitting the rest
+    paragraph_end = content.find("\n\n")
+    excerpt = content if paragraph_end == -1 else content[:paragraph_end]
 
-        if len(excerpt) > max_length:
-            excerpt = excerpt[:max_length].rsplit(" ", 1)[0] + "..."
+    if len(excerpt) > max_length:
+        excerpt = excerpt[:max_length].rsplit(" ", 1)[0] + "..."
 
-        return excerpt.strip()
+    return excerpt.strip()
@@ -28,11 +28,12 @@ class Category(BaseModel):
         if not path:
             return []
 
-        parts = path.split("/")
-        return [
-            {"name": part, "uri": f"docs://{'/'.join(parts[: i + 1])}"}
-            for i, part in enumerate(parts)
-        ]
+        breadcrumbs = []
+        crumb_uri = "docs:/"
+        for part in path.split("/"):
+            crumb_uri = f"{crumb_uri}/{part}"
+            breadcrumbs.append({"name": part, "uri": crumb_uri})
+        return breadcrumbs
 
     @property
     def is_root(self) -> bool:
@@ -1,57 +1,141 @@
 """Caching layer with TTL and file change detection."""
 
+import os
+import pickle
+import sys
+import time
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
-from pydantic import BaseModel
-
 from docs_mcp.core.utils.logger import logger
 
+# How many container/object levels _estimate_size walks below the cached value
+_SIZE_WALK_DEPTH = 3
+
+# Types whose sys.getsizeof already includes their whole payload
+_SCALAR_TYPES = frozenset({str, bytes, bytearray, int, float, bool, type(None)})
+
+# Translation table halving every byte counter of a frequency sketch row
+_HALVE_COUNTERS = bytes(count >> 1 for count in range(256))
 
-class CacheEntry(BaseModel):
-    """Cached parsed content for performance."""
+
+@dataclass(slots=True)
+class CacheEntry:
+    """Cached parsed content for performance.
+
+    A slotted dataclass rather than a Pydantic model: one is built on every
+    cache write and its fields come from the cache itself, so validation
+    buys nothing.
+    """
 
     key: str
     value: Any
     cached_at: datetime
     ttl: int
-    file_mtime: datetime | None = None
+    file_mtime_ns: int | None = None
     size_bytes: int = 0
+    # Expiry deadline on the monotonic clock; 0 derives it from cached_at + ttl
+    expires_at_ns: int = 0
+
+    def __post_init__(self) -> None:
+        if not self.expires_at_ns:
+            remaining = self.ttl - (datetime.now(timezone.utc) - self.cached_at).total_seconds()
+            self.expires_at_ns = time.monotonic_ns() + int(remaining * 1_000_000_000)
 
     @property
     def is_expired(self) -> bool:
         """Check if entry has exceeded TTL."""
-        return (datetime.now(timezone.utc) - self.cached_at).total_seconds() > self.ttl
+        return time.monotonic_ns() > self.expires_at_ns
 
-    def is_stale(self, current_mtime: datetime | None = None) -> bool:
+    def is_stale(self, current_mtime_ns: int | None = None) -> bool:
         """Check if source file has been modified.
 
         Args:
-            current_mtime: Current modification time of source file
+            current_mtime_ns: Current ``st_mtime_ns`` of the source file
 
         Returns:
-            True if file has been modified since caching
+            True if the file's modification time differs from when it was cached
         """
-        if self.file_mtime is None or current_mtime is None:
+        if self.file_mtime_ns is None or current_mtime_ns is None:
             return False
-        return current_mtime > self.file_mtime
+        return current_mtime_ns != self.file_mtime_ns
+
+
+class FrequencySketch:
+    """Count-Min sketch of recent key access frequencies (as used by TinyLFU).
+
+    Each row holds saturating one-byte counters indexed by a different slice of
+    the key's hash; the estimate is the smallest of a key's counters. Every
+    ``sample_size`` increments all counters are halved so old popularity fades.
+    """
+
+    def __init__(self, width: int = 1024, depth: int = 4, sample_size: int | None = None) -> None:
+        """Initialize sketch.
+
+        Args:
+            width: Counters per row (must be a power of two)
+            depth: Number of rows
+            sample_size: Increments between agings (defaults to ``10 * width``)
+        """
+        if width <= 0 or width & (width - 1):
+            raise ValueError(f"Sketch width must be a power of two: {width}")
+        self._rows = [bytearray(width) for _ in range(depth)]
+        self._mask = width - 1
+        self._shift = width.bit_length() - 1
+        self._sample_size = sample_size or 10 * width
+        self._additions = 0
+
+    def increment(self, key: str) -> None:
+        """Record one access to key."""
+        for row, index in zip(self._rows, self._indexes(key), strict=True):
+            if row[index] < 255:
+                row[index] += 1
+
+        self._additions += 1
+        if self._additions >= self._sample_size:
+            self._age()
+
+    def estimate(self, key: str) -> int:
+        """Estimate how often key was accessed recently."""
+        return min(row[index] for row, index in zip(self._rows, self._indexes(key), strict=True))
+
+    def _indexes(self, key: str) -> list[int]:
+        """Return the key's counter index in each row."""
+        key_hash = hash(key)
+        return [(key_hash >> (row * self._shift)) & self._mask for row in range(len(self._rows))]
+
+    def _age(self) -> None:
+        """Halve every counter."""
+        self._rows = [row.translate(_HALVE_COUNTERS) for row in self._rows]
+        self._additions //= 2
 
 
 class Cache:
-    """Simple in-memory cache with TTL and size limits."""
+    """Simple in-memory LRU cache with TTL and size limits."""
 
-    def __init__(self, default_ttl: int = 3600, max_size_mb: int = 500) -> None:
+    def __init__(
+        self, default_ttl: int = 3600, max_size_mb: int = 500, admission_filter: bool = False
+    ) -> None:
         """Initialize cache.
 
         Args:
             default_ttl: Default time-to-live in seconds
             max_size_mb: Maximum cache size in megabytes
+            admission_filter: When the cache is full, only admit a new key that
+                has been requested more often than the entry it would evict
+                (TinyLFU), so one-off keys cannot flush popular entries
         """
-        self._cache: dict[str, CacheEntry] = {}
+        # Ordered from least to most recently used
+        self._cache: OrderedDict[str, CacheEntry] = OrderedDict()
+        # Keys grouped by namespace (text up to and including the first ":")
+        self._namespaces: defaultdict[str, set[str]] = defaultdict(set)
         self._default_ttl = default_ttl
         self._max_size_bytes = max_size_mb * 1024 * 1024
         self._current_size_bytes = 0
+        self._sketch = FrequencySketch() if admission_filter else None
 
     def get(self, key: str, file_path: Path | None = None) -> Any | None:
         """Get value from cache if valid.
@@ -63,6 +147,9 @@ class Cache:
         Returns:
             Cached value if valid, None otherwise
         """
+        if self._sketch is not None:
+            self._sketch.increment(key)
+
         entry = self._cache.get(key)
         if entry is None:
             logger.debug(f"Cache miss: {key}")
@@ -75,13 +162,12 @@ class Cache:
             return None
 
         # Check if file has been modified
-        if file_path and file_path.exists():
-            current_mtime = datetime.fromtimestamp(file_path.stat().st_mtime)
-            if entry.is_stale(current_mtime):
-                logger.debug(f"Cache stale (file modified): {key}")
-                self.invalidate(key)
-                return None
+        if file_path and entry.is_stale(_mtime_ns(file_path)):
+            logger.debug(f"Cache stale (file modified): {key}")
+            self.invalidate(key)
+            return None
 
+        self._cache.move_to_end(key)
         logger.debug(f"Cache hit: {key}")
         return entry.value
 
@@ -100,35 +186,47 @@ class Cache:
             ttl: Time-to-live in seconds (uses default if not specified)
             file_path: Optional file path to track modifications
         """
-        # Estimate size (rough approximation)
-        size_bytes = self._estimate_size(value)
+        # Estimate size (rough approximation); scalars are sized in one call
+        if type(value) in _SCALAR_TYPES:
+            size_bytes = sys.getsizeof(value)
+        else:
+            size_bytes = self._estimate_size(value)
+
+        # Release the replaced entry first so it never forces other evictions
+        old_entry = self._cache.pop(key, None)
+        if old_entry:
+            self._current_size_bytes -= old_entry.size_bytes
 
         # Check if we need to evict entries
-        while self._current_size_bytes + size_bytes > self._max_size_bytes and self._cache:
-            self._evict_oldest()
+        if self._current_size_bytes + size_bytes > self._max_size_bytes and self._cache:
+            if old_entry is None and not self._admits(key):
+                logger.debug(f"Cache admission rejected: {key}")
+                return
+
+            while self._current_size_bytes + size_bytes > self._max_size_bytes and self._cache:
+                self._evict_oldest()
 
         # Get file modification time if path provided
-        file_mtime = None
-        if file_path and file_path.exists():
-            file_mtime = datetime.fromtimestamp(file_path.stat().st_mtime)
+        file_mtime_ns = _mtime_ns(file_path) if file_path else None
 
         # Create entry
+        ttl = ttl or self._default_ttl
         entry = CacheEntry(
             key=key,
             value=value,
             cached_at=datetime.now(timezone.utc),
-            ttl=ttl or self._default_ttl,
-            file_mtime=file_mtime,
+            ttl=ttl,
+            file_mtime_ns=file_mtime_ns,
             size_bytes=size_bytes,
+            expires_at_ns=time.monotonic_ns() + ttl * 1_000_000_000,
         )
 
-        # Update cache
-        old_entry = self._cache.get(key)
-        if old_entry:
-            self._current_size_bytes -= old_entry.size_bytes
-
+        # Update cache (the key was popped above, so it lands most recently used)
         self._cache[key] = entry
         self._current_size_bytes += size_bytes
+        namespace = _namespace(key)
+        if namespace is not None:
+            self._namespaces[namespace].add(key)
 
         logger.debug(
             f"Cache set: {key} (size: {size_bytes} bytes, "
@@ -144,6 +242,7 @@ class Cache:
         entry = self._cache.pop(key, None)
         if entry:
             self._current_size_bytes -= entry.size_bytes
+            self._unindex(key)
             logger.debug(f"Cache invalidated: {key}")
 
     def invalidate_prefix(self, prefix: str) -> int:
@@ -155,7 +254,13 @@ class Cache:
         Returns:
             Number of entries invalidated
         """
-        keys_to_remove = [k for k in self._cache.keys() if k.startswith(prefix)]
+        # Every key starting with a prefix that contains ":" shares its namespace,
+        # so only that namespace's keys need checking
+        namespace = _namespace(prefix)
+        candidates = (
+            self._cache.keys() if namespace is None else self._namespaces.get(namespace, ())
+        )
+        keys_to_remove = [k for k in candidates if k.startswith(prefix)]
         for key in keys_to_remove:
             self.invalidate(key)
         logger.debug(f"Cache invalidated prefix: {prefix} ({len(keys_to_remove)} entries)")
@@ -165,39 +270,53 @@ class Cache:
         """Clear all cache entries."""
         count = len(self._cache)
         self._cache.clear()
+        self._namespaces.clear()
         self._current_size_bytes = 0
         logger.info(f"Cache cleared ({count} entries)")
 
+    def _admits(self, key: str) -> bool:
+        """Check whether a new key is worth evicting the least recently used entry for."""
+        if self._sketch is None:
+            return True
+        victim_key = next(iter(self._cache))
+        return self._sketch.estimate(key) > self._sketch.estimate(victim_key)
+
     def _evict_oldest(self) -> None:
-        """Evict the oldest cache entry (LRU)."""
+        """Evict the least recently used cache entry."""
         if not self._cache:
             return
 
-        # Find oldest entry
-        oldest_key = min(self._cache.keys(), key=lambda k: self._cache[k].cached_at)
-        logger.debug(f"Evicting oldest cache entry: {oldest_key}")
-        self.invalidate(oldest_key)
+        oldest_key, entry = self._cache.popitem(last=False)
+        self._current_size_bytes -= entry.size_bytes
+        self._unindex(oldest_key)
+        logger.debug(f"Evicting least recently used cache entry: {oldest_key}")
+
+    def _unindex(self, key: str) -> None:
+        """Drop a removed key from the namespace index."""
+        namespace = _namespace(key)
+        if namespace is None:
+            return
+        keys = self._namespaces.get(namespace)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._namespaces[namespace]
 
     def _estimate_size(self, value: Any) -> int:
         """Estimate size of value in bytes (rough approximation).
 
+        Uses ``sys.getsizeof`` on the value and, for containers and objects,
+        on their items and attributes a few levels deep, instead of building
+        a string representation of the whole value. Objects without a
+        ``__dict__`` (such as slotted classes) are sized by their pickle.
+
         Args:
             value: Value to estimate
 
         Returns:
             Estimated size in bytes
         """
-        if isinstance(value, str):
-            return len(value.encode("utf-8"))
-        elif isinstance(value, (list, dict)):
-            # Rough estimate for collections
-            return len(str(value).encode("utf-8"))
-        elif hasattr(value, "__dict__"):
-            # For objects, estimate based on string representation
-            return len(str(value.__dict__).encode("utf-8"))
-        else:
-            # Default fallback
-            return 1024  # 1KB default
+        return _sizeof(value, _SIZE_WALK_DEPTH)
 
     @property
     def size(self) -> int:
@@ -215,6 +334,48 @@ class Cache:
         return self._current_size_bytes / (1024 * 1024)
 
 
+def _namespace(key: str) -> str | None:
+    """Return the key's namespace (up to and including the first ":"), if any."""
+    index = key.find(":")
+    return key[: index + 1] if index >= 0 else None
+
+
+def _mtime_ns(file_path: Path) -> int | None:
+    """Return the file's modification time in nanoseconds with one stat, or None if missing."""
+    try:
+        return os.stat(file_path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _sizeof(value: Any, depth: int) -> int:
+    """Sum sys.getsizeof over value and its items/attributes down to depth levels."""
+    size = sys.getsizeof(value)
+    if depth == 0 or type(value) in _SCALAR_TYPES:
+        return size
+
+    items: Any
+    if isinstance(value, dict):
+        items = [*value.keys(), *value.values()]
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        items = value
+    elif hasattr(value, "__dict__"):
+        items = vars(value).values()
+    else:
+        return _pickled_size(value, size)
+
+    return size + sum(_sizeof(item, depth - 1) for item in items)
+
+
+def _pickled_size(value: Any, default: int) -> int:
+    """Size an opaque object (e.g. one using __slots__) by its pickle, or default."""
+    try:
+        return len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        # Unpicklable values (locks, local classes, ...) keep the shallow size
+        return default
+
+
 # Global cache instance
 _cache_instance: Cache | None = None
 
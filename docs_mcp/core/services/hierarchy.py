@@ -1,5 +1,8 @@
 """Hierarchical navigation and category tree building."""
 
+import functools
+import sys
+from collections import defaultdict
 from typing import Any, cast
 
 from docs_mcp.core.models.document import Document
@@ -29,77 +32,46 @@ def build_category_tree(
     """
     categories: dict[str, Category] = {}
 
-    # Create categories from document paths
+    # Group document URIs by their directory in a single pass
+    docs_by_dir: defaultdict[tuple[str, ...], list[str]] = defaultdict(list)
     for doc in documents:
-        # Get all ancestor paths
-        parts = list(doc.relative_path.parts[:-1])  # Exclude filename
-
-        for depth in range(len(parts)):
-            # Build category URI for this level
-            category_parts = parts[: depth + 1]
-            category_uri = "docs://" + "/".join(category_parts)
-
-            if category_uri not in categories:
-                # Determine parent URI
-                parent_uri = None
-                if depth > 0:
-                    parent_parts = category_parts[:-1]
-                    parent_uri = "docs://" + "/".join(parent_parts)
-
-                # Create category
+        docs_by_dir[doc.relative_path.parts[:-1]].append(doc.uri)
+
+    # Create each directory's category chain once, updating counts on the way down
+    for parts, doc_uris in docs_by_dir.items():
+        if not parts:
+            continue
+
+        parent_uri: str | None = None
+        for depth, part in enumerate(parts):
+            # Interned like Document.uri, since category URIs are dict keys and
+            # parent/child links that are compared constantly during navigation
+            category_uri = sys.intern(f"{parent_uri}/{part}" if parent_uri else f"docs://{part}")
+
+            category = categories.get(category_uri)
+            if category is None:
                 category = Category(
-                    name=category_parts[-1],
-                    label=category_parts[-1].replace("-", " ").replace("_", " ").title(),
+                    name=part,
+                    label=part.replace("-", " ").replace("_", " ").title(),
                     uri=category_uri,
                     parent_uri=parent_uri,
                     depth=depth,
                     source_category=source_category,
                 )
                 categories[category_uri] = category
+                if parent_uri is not None:
+                    categories[parent_uri].child_categories.append(category_uri)
 
-        # Add document to its parent category
-        if len(parts) > 0:
-            parent_uri = "docs://" + "/".join(parts)
-            if parent_uri in categories:
-                categories[parent_uri].child_documents.append(doc.uri)
+            # Counts include documents in all descendant categories
+            category.document_count += len(doc_uris)
+            parent_uri = category_uri
 
-    # Build parent-child relationships for categories
-    for uri, category in categories.items():
-        if category.parent_uri and category.parent_uri in categories:
-            parent = categories[category.parent_uri]
-            if uri not in parent.child_categories:
-                parent.child_categories.append(uri)
-
-    # Calculate document counts (including descendants)
-    for category in categories.values():
-        category.document_count = _count_documents_recursive(category, categories)
+        category.child_documents.extend(doc_uris)
 
     logger.info(f"Built category tree with {len(categories)} categories")
     return categories
 
 
-def _count_documents_recursive(
-    category: Category,
-    categories: dict[str, Category],
-) -> int:
-    """Count documents in category and all descendants.
-
-    Args:
-        category: Category to count
-        categories: All categories
-
-    Returns:
-        Total document count
-    """
-    count = len(category.child_documents)
-
-    for child_uri in category.child_categories:
-        if child_uri in categories:
-            count += _count_documents_recursive(categories[child_uri], categories)
-
-    return count
-
-
 def get_breadcrumbs(uri: str) -> list[dict[str, str]]:
     """Generate breadcrumb navigation for a URI.
 
@@ -109,40 +81,58 @@ def get_breadcrumbs(uri: str) -> list[dict[str, str]]:
     Returns:
         List of breadcrumb items with name and URI
     """
+    return [{"name": name, "uri": crumb_uri} for name, crumb_uri in _breadcrumb_items(uri)]
+
+
+@functools.lru_cache(maxsize=4096)
+def _breadcrumb_items(uri: str) -> tuple[tuple[str, str], ...]:
+    """Compute (and memoize) breadcrumb (name, uri) pairs for a URI.
+
+    Breadcrumbs depend only on the URI string, so the cache never needs
+    invalidating when the category tree is rebuilt. Pairs are returned as
+    tuples so cached values cannot be mutated by callers.
+    """
     if not uri.startswith("docs://") and not uri.startswith("api://"):
-        return []
+        return ()
 
-    scheme = uri.split("://")[0]
+    scheme = uri.partition("://")[0]
     path = uri.replace(f"{scheme}://", "")
 
     if not path:
-        return []
+        return ()
 
-    parts = path.split("/")
+    # Extend each crumb URI from the previous one rather than re-joining the parts
     breadcrumbs = []
+    crumb_uri = f"{scheme}:/"
+    for part in path.split("/"):
+        crumb_uri = f"{crumb_uri}/{part}"
+        breadcrumbs.append((part.replace("-", " ").replace("_", " ").title(), crumb_uri))
 
-    for i, part in enumerate(parts):
-        crumb_uri = f"{scheme}://" + "/".join(parts[: i + 1])
-        breadcrumbs.append(
-            {
-                "name": part.replace("-", " ").replace("_", " ").title(),
-                "uri": crumb_uri,
-            }
-        )
+    return tuple(breadcrumbs)
 
-    return breadcrumbs
+
+def build_uri_index(documents: list[Document]) -> dict[str, Document]:
+    """Build a URI to Document index for constant-time lookups.
+
+    Args:
+        documents: List of parsed documents
+
+    Returns:
+        Dictionary mapping document URIs to documents
+    """
+    return {doc.uri: doc for doc in documents}
 
 
 def navigate_to_uri(
     uri: str,
-    documents: list[Document],
+    documents: list[Document] | dict[str, Document],
     categories: dict[str, Category],
 ) -> NavigationContext:
     """Navigate to a URI and get context.
 
     Args:
         uri: Target URI
-        documents: All documents
+        documents: All documents, or a URI index from build_uri_index
         categories: All categories
 
     Returns:
@@ -160,7 +150,9 @@ def navigate_to_uri(
         return _get_category_context(uri, categories)
 
     # Check if it's a document
-    doc = next((d for d in documents if d.uri == uri), None)
+    if isinstance(documents, list):
+        documents = build_uri_index(documents)
+    doc = documents.get(uri)
     if doc:
         return _get_document_context(doc, categories)
 
@@ -219,7 +211,7 @@ def _get_category_context(
     # Add child documents (without loading full content)
     for doc_uri in category.child_documents:
         # Extract name from URI
-        name = doc_uri.split("/")[-1].replace("-", " ").replace("_", " ").title()
+        name = doc_uri.rpartition("/")[2].replace("-", " ").replace("_", " ").title()
         children.append(
             {
                 "type": "document",
@@ -298,11 +290,12 @@ def get_table_of_contents(
         return cast(dict[str, Any], cached)
 
     root_categories = [c for c in categories.values() if c.depth == 0]
+    documents_by_uri = build_uri_index(documents)
 
     children: list[Any] = []
     for root_cat in root_categories:
         if max_depth is None or root_cat.depth < max_depth:
-            children.append(_build_toc_node(root_cat, categories, documents, max_depth))
+            children.append(_build_toc_node(root_cat, categories, documents_by_uri, max_depth))
 
     toc: dict[str, Any] = {
         "type": "root",
@@ -318,7 +311,7 @@ def get_table_of_contents(
 def _build_toc_node(
     category: Category,
     categories: dict[str, Category],
-    documents: list[Document],
+    documents_by_uri: dict[str, Document],
     max_depth: int | None,
 ) -> dict[str, Any]:
     """Build a TOC node for a category."""
@@ -328,11 +321,11 @@ def _build_toc_node(
         for child_uri in category.child_categories:
             if child_uri in categories:
                 child_cat = categories[child_uri]
-                children.append(_build_toc_node(child_cat, categories, documents, max_depth))
+                children.append(_build_toc_node(child_cat, categories, documents_by_uri, max_depth))
 
     if max_depth is None or category.depth + 1 < max_depth:
         for doc_uri in category.child_documents:
-            doc = next((d for d in documents if d.uri == doc_uri), None)
+            doc = documents_by_uri.get(doc_uri)
             if doc:
                 children.append(
                     {
@@ -0,0 +1,15 @@
+"""Trigram extraction for substring search indexes."""
+
+# Dotless and dotted i, which re.IGNORECASE matches with "i" but casefold() keeps apart
+_FOLD_I = str.maketrans({"ı": "i", "İ": "i"})
+
+
+def fold(text: str) -> str:
+    """Casefold text, also folding the Turkish i variants the way re.IGNORECASE does."""
+    return text.translate(_FOLD_I).casefold()
+
+
+def trigrams(text: str) -> set[str]:
+    """Return the distinct folded trigrams in text."""
+    folded = fold(text)
+    return {folded[i : i + 3] for i in range(len(folded) - 2)}
@@ -6,6 +6,7 @@ resource listing, and resource reading — used by both DocumentationMCPServer
 """
 
 import json
+from collections.abc import Awaitable, Callable
 from pathlib import Path
 from typing import Any, cast
 
@@ -18,6 +19,28 @@ from docs_mcp.core.models.navigation import Category
 from docs_mcp.core.utils.logger import logger
 from docs_mcp.mcp.handlers import resources, tools
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
+# Match json.dumps(indent=2) output shape and its acceptance of non-string keys
+_ORJSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS if orjson is not None else 0
+
+
+def _dumps_result(result: Any) -> str:
+    """Serialize a tool result as indented JSON, using orjson when it is installed.
+
+    Falls back to the stdlib encoder for values orjson rejects (such as
+    integers wider than 64 bits) so both paths accept the same results.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(result, option=_ORJSON_OPTIONS).decode()
+        except TypeError:
+            pass
+    return json.dumps(result, indent=2)
+
 
 def get_tool_definitions(*, enable_pdf: bool = False) -> list[Tool]:
     """Return the canonical list of MCP tool definitions.
@@ -204,18 +227,29 @@ def register_mcp_handlers(
     documents: list[Document],
     categories: dict[str, Category],
     config: ServerConfig,
+    documents_by_uri: dict[str, Document] | None = None,
+    ensure_loaded: Callable[[], Awaitable[None]] | None = None,
 ) -> None:
     """Register all MCP protocol handlers on a Server instance.
 
     Closures capture documents/categories by reference so they see
-    data populated later by initialize().
+    data populated later by ensure_loaded().
 
     Args:
         server: MCP Server instance (stdio or SSE transport)
         documents: Mutable list of loaded documents
         categories: Mutable dict of category tree
         config: Server configuration
+        documents_by_uri: Optional mutable URI index kept in sync with documents,
+            used for constant-time lookups by URI
+        ensure_loaded: Optional coroutine awaited before serving any request,
+            used to load documentation lazily
     """
+    indexed_documents = documents if documents_by_uri is None else documents_by_uri
+
+    async def _ensure_loaded() -> None:
+        if ensure_loaded is not None:
+            await ensure_loaded()
 
     @server.list_tools()
     async def list_tools() -> list[Tool]:
@@ -224,32 +258,33 @@ def register_mcp_handlers(
     @server.call_tool()
     async def call_tool(name: str, arguments: Any) -> list[Any]:
         logger.info(f"Tool call: {name}")
+        await _ensure_loaded()
 
         if name == "search_documentation":
             results = await tools.handle_search_documentation(
                 arguments, documents, categories, config.search_limit
             )
-            return [{"type": "text", "text": json.dumps(results, indent=2)}]
+            return [{"type": "text", "text": _dumps_result(results)}]
 
         elif name == "navigate_to":
-            result = await tools.handle_navigate_to(arguments, documents, categories)
-            return [{"type": "text", "text": json.dumps(result, indent=2)}]
+            result = await tools.handle_navigate_to(arguments, indexed_documents, categories)
+            return [{"type": "text", "text": _dumps_result(result)}]
 
         elif name == "get_table_of_contents":
             result = await tools.handle_get_table_of_contents(arguments, documents, categories)
-            return [{"type": "text", "text": json.dumps(result, indent=2)}]
+            return [{"type": "text", "text": _dumps_result(result)}]
 
         elif name == "search_by_tags":
             results = await tools.handle_search_by_tags(arguments, documents, config.search_limit)
-            return [{"type": "text", "text": json.dumps(results, indent=2)}]
+            return [{"type": "text", "text": _dumps_result(results)}]
 
         elif name == "get_document":
-            result = await tools.handle_get_document(arguments, documents)
-            return [{"type": "text", "text": json.dumps(result, indent=2)}]
+            result = await tools.handle_get_document(arguments, indexed_documents)
+            return [{"type": "text", "text": _dumps_result(result)}]
 
         elif name == "get_all_tags":
             result = await tools.handle_get_all_tags(arguments, documents)
-            return [{"type": "text", "text": json.dumps(result, indent=2)}]
+            return [{"type": "text", "text": _dumps_result(result)}]
 
         elif name == "generate_pdf_release":
             if not config.enable_pdf_generation:
@@ -257,13 +292,14 @@ def register_mcp_handlers(
                     "PDF generation is disabled. Set MCP_DOCS_ENABLE_PDF_GENERATION=true to enable."
                 )
             result = await tools.handle_generate_pdf_release(arguments, Path(config.docs_root))
-            return [{"type": "text", "text": json.dumps(result, indent=2)}]
+            return [{"type": "text", "text": _dumps_result(result)}]
 
         else:
             raise ValueError(f"Unknown tool: {name}")
 
     @server.list_resources()
     async def list_resources_handler() -> list[Resource]:
+        await _ensure_loaded()
         resource_list = await resources.list_resources(documents, categories)
         return [
             Resource(
@@ -277,7 +313,8 @@ def register_mcp_handlers(
 
     @server.read_resource()
     async def read_resource(uri: str) -> str:
-        result = await resources.handle_resource_read(uri, documents, categories)
+        await _ensure_loaded()
+        result = await resources.handle_resource_read(uri, indexed_documents, categories)
         if "error" in result:
             raise ValueError(result["error"])
         return cast(str, result.get("text", ""))
@@ -1,58 +1,69 @@
 """MCP resource handlers for URI-based documentation access."""
 
+import sys
 from typing import Any
 
 from docs_mcp.core.models.document import Document
 from docs_mcp.core.models.navigation import Category
+from docs_mcp.core.services.hierarchy import build_uri_index
 from docs_mcp.core.utils.logger import logger
 
+# One shared string object for the mimeType of every markdown resource entry
+_MARKDOWN_MIME = sys.intern("text/markdown")
+
 
 async def handle_resource_read(
     uri: str,
-    documents: list[Document],
+    documents: list[Document] | dict[str, Document],
     categories: dict[str, Category],
 ) -> dict[str, Any]:
-    """Handle resource read request for a docs:// URI."""
+    """Handle resource read request for a docs:// URI.
+
+    ``documents`` may be a URI index from build_uri_index to avoid rebuilding it.
+    """
     logger.info(f"Resource read request: {uri}")
 
     try:
-        doc = next((d for d in documents if d.uri == uri), None)
+        if isinstance(documents, list):
+            documents = build_uri_index(documents)
+
+        doc = documents.get(uri)
         if doc:
             return {
                 "uri": doc.uri,
-                "mimeType": "text/markdown",
+                "mimeType": _MARKDOWN_MIME,
                 "text": doc.content,
                 "metadata": {
                     "title": doc.title,
                     "tags": doc.tags,
                     "category": doc.category,
-                    "last_modified": doc.last_modified.isoformat(),
+                    "last_modified": doc.last_modified_iso,
                 },
             }
 
         if uri in categories:
             category = categories[uri]
-            content = f"# {category.label}\n\n"
-            content += f"**Documents**: {category.document_count}\n\n"
+            # Collected as parts and joined once rather than concatenated per line
+            parts = [f"# {category.label}\n\n", f"**Documents**: {category.document_count}\n\n"]
 
             if category.child_categories:
-                content += "## Subcategories\n\n"
+                parts.append("## Subcategories\n\n")
                 for child_uri in category.child_categories:
-                    if child_uri in categories:
-                        child = categories[child_uri]
-                        content += f"- [{child.label}]({child.uri})\n"
+                    child = categories.get(child_uri)
+                    if child:
+                        parts.append(f"- [{child.label}]({child.uri})\n")
 
             if category.child_documents:
-                content += "\n## Documents\n\n"
+                parts.append("\n## Documents\n\n")
                 for doc_uri in category.child_documents:
-                    doc = next((d for d in documents if d.uri == doc_uri), None)
+                    doc = documents.get(doc_uri)
                     if doc:
-                        content += f"- [{doc.title}]({doc.uri})\n"
+                        parts.append(f"- [{doc.title}]({doc.uri})\n")
 
             return {
                 "uri": uri,
-                "mimeType": "text/markdown",
-                "text": content,
+                "mimeType": _MARKDOWN_MIME,
+                "text": "".join(parts),
                 "metadata": {
                     "type": "category",
                     "name": category.label,
@@ -72,36 +83,32 @@ async def list_resources(
     categories: dict[str, Category],
 ) -> list[dict[str, Any]]:
     """List all available resources."""
-    resources = []
-
-    resources.append(
+    resources: list[dict[str, Any]] = [
         {
             "uri": "docs://",
             "name": "Documentation Root",
-            "mimeType": "text/markdown",
+            "mimeType": _MARKDOWN_MIME,
             "description": "Root of documentation hierarchy",
         }
+    ]
+    resources.extend(
+        {
+            "uri": category.uri,
+            "name": category.label,
+            "mimeType": _MARKDOWN_MIME,
+            "description": f"Category with {category.document_count} documents",
+        }
+        for category in categories.values()
+    )
+    resources.extend(
+        {
+            "uri": doc.uri,
+            "name": doc.title,
+            "mimeType": _MARKDOWN_MIME,
+            "description": doc.excerpt(100),
+        }
+        for doc in documents
     )
-
-    for category in categories.values():
-        resources.append(
-            {
-                "uri": category.uri,
-                "name": category.label,
-                "mimeType": "text/markdown",
-                "description": f"Category with {category.document_count} documents",
-            }
-        )
-
-    for doc in documents:
-        resources.append(
-            {
-                "uri": doc.uri,
-                "name": doc.title,
-                "mimeType": "text/markdown",
-                "description": doc.excerpt(100),
-            }
-        )
 
     logger.info(f"Listed {len(resources)} resources")
     return resources
@@ -8,6 +8,7 @@ from typing import Any
 from docs_mcp.core.models.document import Document
 from docs_mcp.core.models.navigation import Category
 from docs_mcp.core.services.hierarchy import (
+    build_uri_index,
     get_table_of_contents,
     navigate_to_uri,
 )
@@ -57,7 +58,7 @@ async def handle_search_documentation(
 
 async def handle_navigate_to(
     arguments: dict[str, Any],
-    documents: list[Document],
+    documents: list[Document] | dict[str, Document],
     categories: dict[str, Category],
 ) -> dict[str, Any]:
     """Handle navigate_to tool request."""
@@ -121,6 +122,7 @@ async def handle_search_by_tags(
             documents=documents,
             limit=limit,
         )
+        documents_by_uri = build_uri_index(documents)
 
         return [
             {
@@ -129,7 +131,7 @@ async def handle_search_by_tags(
                 "excerpt": result.excerpt,
                 "breadcrumbs": result.breadcrumb_string,
                 "category": result.category,
-                "tags": [doc.tags for doc in documents if doc.uri == result.document_uri][0],
+                "tags": documents_by_uri[result.document_uri].tags,
             }
             for result in results
         ]
@@ -141,15 +143,21 @@ async def handle_search_by_tags(
 
 async def handle_get_document(
     arguments: dict[str, Any],
-    documents: list[Document],
+    documents: list[Document] | dict[str, Document],
 ) -> dict[str, Any]:
-    """Handle get_document tool request."""
+    """Handle get_document tool request.
+
+    ``documents`` may be a URI index from build_uri_index to avoid rebuilding it.
+    """
     uri = arguments.get("uri", "")
 
     logger.info(f"Get document request: uri='{uri}'")
 
     try:
-        doc = next((d for d in documents if d.uri == uri), None)
+        if isinstance(documents, list):
+            documents = build_uri_index(documents)
+
+        doc = documents.get(uri)
 
         if not doc:
             return {"error": f"Document not found: {uri}"}
@@ -160,7 +168,7 @@ async def handle_get_document(
             "content": doc.content,
             "tags": doc.tags,
             "category": doc.category,
-            "last_modified": doc.last_modified.isoformat(),
+            "last_modified": doc.last_modified_iso,
             "breadcrumbs": [crumb for crumb in doc.breadcrumbs],
         }
 
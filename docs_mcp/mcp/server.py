@@ -8,8 +8,8 @@ from mcp.server.stdio import stdio_server
 from docs_mcp.core.config import ServerConfig
 from docs_mcp.core.models.document import Document
 from docs_mcp.core.models.navigation import Category
-from docs_mcp.core.services.hierarchy import build_category_tree
-from docs_mcp.core.services.markdown import scan_markdown_files
+from docs_mcp.core.services.hierarchy import build_category_tree, build_uri_index
+from docs_mcp.core.services.markdown import iter_markdown_files
 from docs_mcp.core.utils.logger import logger
 from docs_mcp.mcp.handlers.registry import register_mcp_handlers
 
@@ -33,34 +33,77 @@ class DocumentationMCPServer:
         self.server = Server("hierarchical-docs-mcp")
         self.documents: list[Document] = []
         self.categories: dict[str, Category] = {}
-
-        register_mcp_handlers(self.server, self.documents, self.categories, self.config)
+        self.documents_by_uri: dict[str, Document] = {}
+        self._loaded = False
+        self._load_lock = asyncio.Lock()
+
+        register_mcp_handlers(
+            self.server,
+            self.documents,
+            self.categories,
+            self.config,
+            documents_by_uri=self.documents_by_uri,
+            ensure_loaded=self.ensure_loaded,
+        )
 
     async def initialize(self) -> None:
-        """Initialize the server by loading documentation."""
-        logger.info("Initializing documentation server...")
+        """Prepare the server without loading documentation.
+
+        Documentation is scanned on first use by ensure_loaded(), so start-up
+        does not block on reading every markdown file.
+        """
+        logger.info(
+            f"Initializing documentation server with {len(self.config.sources)} source(s); "
+            "documentation will load on first request"
+        )
+        self._loaded = False
+
+    async def ensure_loaded(self) -> None:
+        """Load documentation once, on first use.
+
+        Concurrent callers wait on the same load instead of scanning twice.
+        """
+        if self._loaded:
+            return
+
+        async with self._load_lock:
+            if self._loaded:
+                return
+            self._load_documentation()
+            self._loaded = True
+
+    def _load_documentation(self) -> None:
+        """Scan configured sources and build the category tree and indexes."""
+        logger.info("Loading documentation...")
 
         for source in self.config.sources:
             logger.info(f"Loading documentation from: {source.path}")
 
+            loaded_before = len(self.documents)
             try:
-                docs = scan_markdown_files(
-                    source_path=source.path,
-                    doc_root=source.path,
-                    recursive=source.recursive,
-                    include_patterns=source.include_patterns,
-                    exclude_patterns=source.exclude_patterns,
-                    allow_hidden=self.config.allow_hidden,
+                # Stream straight into the shared list instead of building a copy
+                self.documents.extend(
+                    iter_markdown_files(
+                        source_path=source.path,
+                        doc_root=source.path,
+                        recursive=source.recursive,
+                        include_patterns=source.include_patterns,
+                        exclude_patterns=source.exclude_patterns,
+                        allow_hidden=self.config.allow_hidden,
+                    )
+                )
+                logger.info(
+                    f"Loaded {len(self.documents) - loaded_before} documents from {source.path}"
                 )
-
-                self.documents.extend(docs)
-                logger.info(f"Loaded {len(docs)} documents from {source.path}")
 
             except Exception as e:
                 logger.error(f"Failed to load documentation from {source.path}: {e}")
 
+        self.documents_by_uri.update(build_uri_index(self.documents))
+
         if self.documents:
-            self.categories = build_category_tree(self.documents)
+            # Update in place: registered handlers hold a reference to this dict
+            self.categories.update(build_category_tree(self.documents))
             logger.info(f"Built category tree with {len(self.categories)} categories")
 
             try:
@@ -71,8 +114,7 @@ class DocumentationMCPServer:
                 logger.error(f"Failed to index documents: {e}")
 
         logger.info(
-            f"Initialization complete: {len(self.documents)} documents, "
-            f"{len(self.categories)} categories"
+            f"Loading complete: {len(self.documents)} documents, {len(self.categories)} categories"
         )
 
     async def run(self) -> None:
@@ -100,6 +142,8 @@ async def serve_both(config: ServerConfig) -> None:
 
     mcp_server = DocumentationMCPServer(config)
     await mcp_server.initialize()
+    # The web server renders pages directly from the loaded documents
+    await mcp_server.ensure_loaded()
 
     async def run_web_server() -> None:
         web_server = DocumentationWebServer(
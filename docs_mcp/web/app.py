@@ -17,6 +17,7 @@ from starlette.routing import Mount, Route
 from docs_mcp.core.config import ServerConfig
 from docs_mcp.core.models.document import Document
 from docs_mcp.core.models.navigation import Category
+from docs_mcp.core.services.hierarchy import build_uri_index
 from docs_mcp.core.utils.logger import logger
 from docs_mcp.mcp.handlers import tools
 from docs_mcp.mcp.handlers.registry import register_mcp_handlers
@@ -89,11 +90,18 @@ class DocumentationWebServer:
         self.config = config
         self.documents = documents
         self.categories = categories
+        self.documents_by_uri = build_uri_index(documents)
 
         # Create the MCP server for SSE transport (only if MCP transport is enabled)
         if self.config.enable_mcp_transport:
             self.mcp_server = Server("hierarchical-docs-mcp")
-            register_mcp_handlers(self.mcp_server, self.documents, self.categories, self.config)
+            register_mcp_handlers(
+                self.mcp_server,
+                self.documents,
+                self.categories,
+                self.config,
+                documents_by_uri=self.documents_by_uri,
+            )
             self.sse_transport = SseServerTransport("/messages/")
         else:
             self.mcp_server = None
@@ -235,7 +243,7 @@ class DocumentationWebServer:
             try:
                 result = await tools.handle_navigate_to(
                     arguments={"uri": request.uri},
-                    documents=self.documents,
+                    documents=self.documents_by_uri,
                     categories=self.categories,
                 )
                 return JSONResponse(content=result)
@@ -251,7 +259,7 @@ class DocumentationWebServer:
             try:
                 result = await tools.handle_navigate_to(
                     arguments={"uri": uri},
-                    documents=self.documents,
+                    documents=self.documents_by_uri,
                     categories=self.categories,
                 )
                 return JSONResponse(content=result)
@@ -313,7 +321,7 @@ class DocumentationWebServer:
             try:
                 result = await tools.handle_get_document(
                     arguments={"uri": request.uri},
-                    documents=self.documents,
+                    documents=self.documents_by_uri,
                 )
                 return JSONResponse(content=result)
             except Exception as e:
@@ -328,7 +336,7 @@ class DocumentationWebServer:
             try:
                 result = await tools.handle_get_document(
                     arguments={"uri": uri},
-                    documents=self.documents,
+                    documents=self.documents_by_uri,
                 )
                 return JSONResponse(content=result)
             except Exception as e:
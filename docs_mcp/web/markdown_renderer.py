@@ -1,5 +1,6 @@
 """Server-side markdown to HTML rendering with Pygments syntax highlighting."""
 
+import functools
 import re
 from typing import Any
 
@@ -118,12 +119,25 @@ def _get_processor() -> markdown.Markdown:
 def render_markdown(content: str) -> dict[str, Any]:
     """Render markdown content to HTML with extracted TOC.
 
+    Rendering is memoized by content, so repeat views of an unchanged
+    document skip the markdown pipeline.
+
     Args:
         content: Raw markdown string
 
     Returns:
         Dict with 'html' (rendered HTML) and 'toc' (list of heading dicts)
     """
+    html, toc_items = _render_cached(content)
+    return {
+        "html": html,
+        "toc": [dict(item) for item in toc_items],
+    }
+
+
+@functools.lru_cache(maxsize=128)
+def _render_cached(content: str) -> tuple[str, tuple[dict[str, Any], ...]]:
+    """Render content once per distinct string; callers must copy the TOC items."""
     md = _get_processor()
     md.reset()
 
@@ -140,10 +154,7 @@ def render_markdown(content: str) -> dict[str, Any]:
     if hasattr(md, "toc_tokens"):
         toc_items = _flatten_toc(md.toc_tokens)
 
-    return {
-        "html": html,
-        "toc": toc_items,
-    }
+    return html, tuple(toc_items)
 
 
 def _flatten_toc(tokens: list[dict[str, Any]], depth: int = 0) -> list[dict[str, Any]]:
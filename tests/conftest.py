@@ -0,0 +1,12 @@
+"""Shared pytest fixtures."""
+
+import pytest
+
+from docs_mcp.core.services.cache import get_cache
+
+
+@pytest.fixture(autouse=True)
+def clear_global_cache():
+    """Isolate tests from results cached by earlier tests in the same worker."""
+    get_cache().clear()
+    yield
@@ -4,6 +4,7 @@ import pytest
 
 from docs_mcp.core.services.hierarchy import (
     build_category_tree,
+    build_uri_index,
     get_breadcrumbs,
     get_table_of_contents,
     navigate_to_uri,
@@ -23,10 +24,14 @@ from docs_mcp.mcp.handlers.tools import (
 )
 
 
-@pytest.fixture
-def test_docs_structure(tmp_path):
-    """Create a realistic test documentation structure."""
-    doc_root = tmp_path / "docs"
+@pytest.fixture(scope="module")
+def test_docs_structure(tmp_path_factory):
+    """Create a realistic test documentation structure, written once per module.
+
+    Tests only read these files; anything that needs to modify the tree
+    should build its own under ``tmp_path``.
+    """
+    doc_root = tmp_path_factory.mktemp("navigation") / "docs"
     doc_root.mkdir()
 
     # Create guides section
@@ -176,6 +181,7 @@ def loaded_documentation(test_docs_structure):
     categories = build_category_tree(documents)
     return {
         "documents": documents,
+        "documents_by_uri": build_uri_index(documents),
         "categories": categories,
         "root": test_docs_structure,
     }
@@ -247,6 +253,7 @@ class TestEndToEndNavigation:
     def test_search_by_tags(self, loaded_documentation):
         """Test searching by metadata tags."""
         docs = loaded_documentation["documents"]
+        docs_by_uri = loaded_documentation["documents_by_uri"]
 
         # Search for documents with "api" tag
         results = search_by_metadata(tags=["api"], documents=docs, limit=10)
@@ -256,7 +263,7 @@ class TestEndToEndNavigation:
 
         # All results should have "api" tag
         for result in results:
-            doc = next((d for d in docs if d.uri == result.document_uri), None)
+            doc = docs_by_uri.get(result.document_uri)
             if doc:
                 assert "api" in doc.tags
 
@@ -396,6 +403,17 @@ class TestMCPResourcesIntegration:
         # Should list child items
         assert len(result["text"]) > 0
 
+    @pytest.mark.asyncio
+    async def test_read_resource_with_uri_index(self, loaded_documentation):
+        """Test the resource handler accepts a prebuilt URI index."""
+        docs = loaded_documentation["documents"]
+        docs_by_uri = loaded_documentation["documents_by_uri"]
+        cats = loaded_documentation["categories"]
+
+        for uri in ("docs://guides/getting-started", "docs://guides"):
+            indexed = await handle_resource_read(uri, docs_by_uri, cats)
+            assert indexed == await handle_resource_read(uri, docs, cats)
+
     @pytest.mark.asyncio
     async def test_list_all_resources(self, loaded_documentation):
         """Test listing all available resources."""
@@ -523,18 +541,15 @@ class TestRealWorldScenarios:
         docs = loaded_documentation["documents"]
         cats = loaded_documentation["categories"]
 
-        # AI gets table of contents
         toc = await handle_get_table_of_contents({}, docs, cats)
+        perf_results = await handle_search_documentation(
+            {"query": "performance", "limit": 5}, docs, cats, 10
+        )
 
         # AI identifies main categories
         category_count = len(toc["children"])
         assert category_count >= 2  # guides and api
 
-        # AI searches for specific topics
-        perf_results = await handle_search_documentation(
-            {"query": "performance", "limit": 5}, docs, cats, 10
-        )
-
         # AI can find relevant content
         assert len(perf_results) > 0
 
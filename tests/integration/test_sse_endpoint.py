@@ -11,6 +11,9 @@ import uvicorn
 from docs_mcp.core.config import ServerConfig
 from docs_mcp.web.app import DocumentationWebServer
 
+# Share one running server (and its event loop) across the whole test session
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
 
 def _get_free_port() -> int:
     with socket.socket() as sock:
@@ -18,11 +21,22 @@ def _get_free_port() -> int:
         return sock.getsockname()[1]
 
 
-@pytest_asyncio.fixture
-async def running_sse_server(tmp_path):
-    """Start the documentation web server with SSE support on a free port."""
-    docs_root = tmp_path / "docs"
-    docs_root.mkdir()
+class _NotifyingServer(uvicorn.Server):
+    """Uvicorn server that signals an event once startup has completed."""
+
+    def __init__(self, config: uvicorn.Config) -> None:
+        super().__init__(config=config)
+        self.startup_complete = asyncio.Event()
+
+    async def startup(self, sockets=None):  # type: ignore[no-untyped-def]
+        await super().startup(sockets=sockets)
+        self.startup_complete.set()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def session_sse_server(tmp_path_factory):
+    """Start the documentation web server with SSE support on a free port, once per session."""
+    docs_root = tmp_path_factory.mktemp("docs")
 
     config = ServerConfig(docs_root=docs_root)
     web_server = DocumentationWebServer(config=config, documents=[], categories={})
@@ -35,28 +49,29 @@ async def running_sse_server(tmp_path):
         log_level="error",
         loop="asyncio",
     )
-    server = uvicorn.Server(config=server_config)
+    server = _NotifyingServer(config=server_config)
 
     server_task = asyncio.create_task(server.serve())
+    startup_task = asyncio.create_task(server.startup_complete.wait())
 
     try:
-        for _ in range(200):
-            if server.started:
-                break
-            await asyncio.sleep(0.05)
-        else:  # pragma: no cover - defensive timeout
+        # Startup failures end serve() without ever setting the event
+        await asyncio.wait(
+            {server_task, startup_task}, timeout=10, return_when=asyncio.FIRST_COMPLETED
+        )
+        if not server.started:  # pragma: no cover - defensive timeout
             raise RuntimeError("SSE test server failed to start in time")
 
         yield f"http://127.0.0.1:{port}"
     finally:
+        startup_task.cancel()
         server.should_exit = True
         await server_task
 
 
-@pytest.mark.asyncio
-async def test_sse_endpoint_returns_event_stream(running_sse_server: str):
+async def test_sse_endpoint_returns_event_stream(session_sse_server: str):
     """Ensure the SSE endpoint emits the expected endpoint event."""
-    async with httpx.AsyncClient(base_url=running_sse_server) as client:
+    async with httpx.AsyncClient(base_url=session_sse_server) as client:
         async with client.stream("GET", "/sse") as response:
             assert response.status_code == 200
             content_type = response.headers.get("content-type", "")
@@ -2,7 +2,14 @@
 
 import pytest
 
-from docs_mcp.core.config import BrandingConfig, ServerConfig, _apply_yaml_config, load_config
+from docs_mcp.core.config import (
+    BrandingConfig,
+    ServerConfig,
+    _apply_yaml_config,
+    _parse_yaml_file,
+    _read_yaml_config,
+    load_config,
+)
 
 
 class TestBrandingConfigDefaults:
@@ -289,6 +296,31 @@ sources:
         config = load_config()
         assert config.branding.site_name == "Test Docs"
 
+    def test_load_config_reuses_parsed_yaml_until_file_changes(self, tmp_path, monkeypatch):
+        yaml_file = tmp_path / ".your-docs.yaml"
+        yaml_file.write_text('branding:\n  site_name: "First"\n')
+        monkeypatch.chdir(tmp_path)
+        _parse_yaml_file.cache_clear()
+
+        assert load_config().branding.site_name == "First"
+        assert load_config().branding.site_name == "First"
+        assert _parse_yaml_file.cache_info().hits == 1
+
+        yaml_file.write_text('branding:\n  site_name: "Second Edit"\n')
+
+        assert load_config().branding.site_name == "Second Edit"
+
+    def test_read_yaml_config_returns_private_copy(self, tmp_path):
+        yaml_file = tmp_path / ".your-docs.yaml"
+        yaml_file.write_text('branding:\n  site_name: "First"\n')
+        stat = yaml_file.stat()
+        key = (str(yaml_file), stat.st_mtime_ns, stat.st_size)
+
+        first = _read_yaml_config(*key)
+        first["branding"]["site_name"] = "Mutated"
+
+        assert _read_yaml_config(*key)["branding"]["site_name"] == "First"
+
     def test_load_config_works_without_yaml(self, tmp_path, monkeypatch):
         monkeypatch.chdir(tmp_path)
         config = load_config()
@@ -392,3 +424,33 @@ class TestToolDefinitionsPDFGating:
 
         tools = get_tool_definitions(enable_pdf=True)
         assert len(tools) == 7
+
+
+class TestToolResultSerialization:
+    """Test tool results serialize to the same JSON with or without orjson."""
+
+    def test_dumps_result_round_trips(self):
+        import json
+
+        from docs_mcp.mcp.handlers.registry import _dumps_result
+
+        result = {"title": "Caf\u00e9", "tags": ["a", "b"], "count": 3, "nested": {"ok": True}}
+        assert json.loads(_dumps_result(result)) == result
+
+    def test_dumps_result_without_orjson(self, monkeypatch):
+        import json
+
+        from docs_mcp.mcp.handlers import registry
+
+        monkeypatch.setattr(registry, "orjson", None)
+
+        result = [{"uri": "docs://guides", "relevance": 0.5}]
+        assert registry._dumps_result(result) == json.dumps(result, indent=2)
+
+    def test_dumps_result_falls_back_for_values_orjson_rejects(self):
+        import json
+
+        from docs_mcp.mcp.handlers.registry import _dumps_result
+
+        result = {"size": 2**70}
+        assert json.loads(_dumps_result(result)) == result
@@ -3,7 +3,9 @@
 import time
 from datetime import datetime, timedelta, timezone
 
-from docs_mcp.core.services.cache import Cache, CacheEntry, get_cache
+import pytest
+
+from docs_mcp.core.services.cache import Cache, CacheEntry, FrequencySketch, get_cache
 
 
 class TestCacheEntry:
@@ -22,6 +24,19 @@ class TestCacheEntry:
         assert entry.value == "test_value"
         assert entry.ttl == 3600
 
+    def test_cache_entry_is_slotted(self):
+        """Test entries are slotted records that accept an explicit deadline."""
+        entry = CacheEntry(
+            key="test_key",
+            value="test_value",
+            cached_at=datetime.now(timezone.utc),
+            ttl=3600,
+            expires_at_ns=time.monotonic_ns() - 1,
+        )
+
+        assert not hasattr(entry, "__dict__")
+        assert entry.is_expired is True
+
     def test_is_expired_fresh_entry(self):
         """Test that fresh entries are not expired."""
         entry = CacheEntry(
@@ -44,6 +59,21 @@ class TestCacheEntry:
 
         assert entry.is_expired is True
 
+    def test_is_expired_uses_monotonic_deadline(self, monkeypatch):
+        """Test that expiry is checked against a monotonic deadline."""
+        entry = CacheEntry(
+            key="test",
+            value="value",
+            cached_at=datetime.now(timezone.utc),
+            ttl=60,
+        )
+
+        assert entry.is_expired is False
+
+        deadline = time.monotonic_ns() + 61 * 1_000_000_000
+        monkeypatch.setattr(time, "monotonic_ns", lambda: deadline)
+        assert entry.is_expired is True
+
     def test_is_stale_no_mtime(self):
         """Test that entries without mtime are not stale."""
         entry = CacheEntry(
@@ -51,40 +81,54 @@ class TestCacheEntry:
             value="value",
             cached_at=datetime.now(timezone.utc),
             ttl=3600,
-            file_mtime=None,
+            file_mtime_ns=None,
         )
 
         assert entry.is_stale(None) is False
-        assert entry.is_stale(datetime.now(timezone.utc)) is False
+        assert entry.is_stale(time.time_ns()) is False
 
     def test_is_stale_file_modified(self):
         """Test that entries are stale when file is modified."""
-        old_time = datetime.now(timezone.utc) - timedelta(hours=1)
-        new_time = datetime.now(timezone.utc)
+        old_mtime_ns = time.time_ns() - 3600 * 1_000_000_000
+        new_mtime_ns = time.time_ns()
+
+        entry = CacheEntry(
+            key="test",
+            value="value",
+            cached_at=datetime.now(timezone.utc),
+            ttl=3600,
+            file_mtime_ns=old_mtime_ns,
+        )
+
+        assert entry.is_stale(new_mtime_ns) is True
+
+    def test_is_stale_file_restored_to_older_version(self):
+        """Test that entries are stale when the file's mtime moves backwards."""
+        cached_mtime_ns = time.time_ns()
 
         entry = CacheEntry(
             key="test",
             value="value",
-            cached_at=old_time,
+            cached_at=datetime.now(timezone.utc),
             ttl=3600,
-            file_mtime=old_time,
+            file_mtime_ns=cached_mtime_ns,
         )
 
-        assert entry.is_stale(new_time) is True
+        assert entry.is_stale(cached_mtime_ns - 1_000_000_000) is True
 
     def test_is_stale_file_not_modified(self):
         """Test that entries are not stale when file hasn't changed."""
-        cache_time = datetime.now(timezone.utc)
+        mtime_ns = time.time_ns()
 
         entry = CacheEntry(
             key="test",
             value="value",
-            cached_at=cache_time,
+            cached_at=datetime.now(timezone.utc),
             ttl=3600,
-            file_mtime=cache_time,
+            file_mtime_ns=mtime_ns,
         )
 
-        assert entry.is_stale(cache_time) is False
+        assert entry.is_stale(mtime_ns) is False
 
 
 class TestCache:
@@ -210,6 +254,31 @@ class TestCache:
         assert cache.get("docs:file2") is None
         assert cache.get("api:endpoint1") == "value3"
 
+    def test_invalidate_prefix_within_and_across_namespaces(self):
+        """Test prefix invalidation for partial, nested and colon-free prefixes."""
+        cache = Cache()
+        cache.set("search:auth:None:10", "a")
+        cache.set("search:api:None:10", "b")
+        cache.set("searching", "c")
+        cache.set("toc:None", "d")
+
+        assert cache.invalidate_prefix("search:au") == 1
+        assert cache.get("search:api:None:10") == "b"
+
+        # Prefixes without ":" still match keys across namespaces
+        assert cache.invalidate_prefix("search") == 2
+        assert cache.get("toc:None") == "d"
+
+    def test_namespace_index_follows_removals(self):
+        """Test the namespace index drops keys that were invalidated or evicted."""
+        cache = Cache(max_size_mb=1)
+        cache.set("docs:a", "x" * (600 * 1024))
+        cache.set("docs:b", "x" * (600 * 1024))  # evicts docs:a
+        cache.invalidate("docs:b")
+
+        assert cache.invalidate_prefix("docs:") == 0
+        assert cache._namespaces == {}
+
     def test_clear_cache(self):
         """Test clearing all cache entries."""
         cache = Cache()
@@ -280,6 +349,65 @@ class TestCache:
         # Newer entries should still be there
         assert cache.get("key6") is not None
 
+    def test_cache_eviction_spares_recently_read_entries(self):
+        """Test that reading an entry protects it from the next eviction."""
+        cache = Cache(max_size_mb=1)
+        large_value = "x" * (300 * 1024)  # 300KB each
+
+        cache.set("key1", large_value)
+        cache.set("key2", large_value)
+        cache.set("key3", large_value)
+
+        # Touch the oldest entry so key2 becomes the least recently used
+        assert cache.get("key1") is not None
+
+        cache.set("key4", large_value)
+
+        assert cache.get("key2") is None
+        assert cache.get("key1") is not None
+        assert cache.get("key4") is not None
+
+    def test_admission_filter_keeps_popular_entries(self):
+        """Test that one-off keys cannot evict entries read more often."""
+        cache = Cache(max_size_mb=1, admission_filter=True)
+        large_value = "x" * (300 * 1024)  # 300KB each
+
+        for key in ("key1", "key2", "key3"):
+            cache.set(key, large_value)
+            assert cache.get(key) is not None
+
+        # Requested once, so no more popular than the least recently used entry
+        cache.set("one-off", large_value)
+
+        assert "one-off" not in cache._cache
+        assert cache.get("key1") is not None
+
+    def test_admission_filter_admits_frequently_requested_keys(self):
+        """Test that a key requested more often than the victim is admitted."""
+        cache = Cache(max_size_mb=1, admission_filter=True)
+        large_value = "x" * (300 * 1024)  # 300KB each
+
+        for key in ("key1", "key2", "key3"):
+            cache.set(key, large_value)
+
+        for _ in range(3):
+            assert cache.get("hot") is None
+        cache.set("hot", large_value)
+
+        assert cache.get("hot") is not None
+        assert cache.get("key1") is None
+
+    def test_admission_filter_always_replaces_existing_keys(self):
+        """Test that updating a cached key bypasses the admission filter."""
+        cache = Cache(max_size_mb=1, admission_filter=True)
+        large_value = "x" * (400 * 1024)  # 400KB each
+
+        cache.set("key1", large_value)
+        cache.set("key2", large_value)
+        cache.set("key2", large_value + "y" * (300 * 1024))
+
+        assert cache.get("key2") is not None
+
     def test_cache_update_existing_key(self):
         """Test updating an existing cache key."""
         cache = Cache()
@@ -304,6 +432,18 @@ class TestCache:
         # Size should increase after update
         assert size_after_update > size_after_first
 
+    def test_replacing_entry_does_not_evict_others(self):
+        """Test that replacing a key releases its old size before evicting."""
+        cache = Cache(max_size_mb=1)
+        large_value = "x" * (400 * 1024)  # 400KB each
+
+        cache.set("key1", large_value)
+        cache.set("key2", large_value)
+        cache.set("key2", large_value)
+
+        assert cache.get("key1") is not None
+        assert cache.size_bytes == 2 * cache._estimate_size(large_value)
+
     def test_estimate_size_string(self):
         """Test size estimation for strings."""
         cache = Cache()
@@ -345,6 +485,41 @@ class TestCache:
 
         assert estimated > 0
 
+    def test_estimate_size_counts_nested_payloads(self):
+        """Test object and container estimates include the data they hold."""
+        cache = Cache()
+
+        class Holder:
+            def __init__(self, payload):
+                self.payload = payload
+
+        payload = "x" * 10000
+        assert cache._estimate_size([Holder(payload)]) > len(payload)
+        assert cache._estimate_size({"key": [payload]}) > len(payload)
+
+    def test_set_sizes_scalars_without_walking(self, monkeypatch):
+        """Test scalar values are sized directly without the generic estimator."""
+        cache = Cache()
+
+        def fail(value):
+            raise AssertionError("generic estimator used for a scalar")
+
+        monkeypatch.setattr(cache, "_estimate_size", fail)
+
+        cache.set("text", "value")
+        cache.set("number", 42)
+        cache.set("nothing", None)
+
+        assert cache.size == 3
+        assert cache.size_bytes > 0
+
+    def test_estimate_size_slotted_object(self):
+        """Test objects without a __dict__ are sized by their payload."""
+        cache = Cache()
+        entry = CacheEntry(key="k", value="x" * 10000, cached_at=datetime.now(timezone.utc), ttl=60)
+
+        assert cache._estimate_size(entry) > 10000
+
     def test_concurrent_operations(self):
         """Test that cache handles concurrent-like operations."""
         cache = Cache()
@@ -402,11 +577,50 @@ class TestCache:
         cache = Cache()
         cache.set("key", "value", file_path=nonexistent)
 
-        # Should still cache (file_mtime will be None)
+        # Should still cache (file_mtime_ns will be None)
         result = cache.get("key", nonexistent)
         assert result == "value"
 
 
+class TestFrequencySketch:
+    """Test FrequencySketch counting and aging."""
+
+    def test_estimate_counts_increments(self):
+        """Test that estimates track how often a key was recorded."""
+        sketch = FrequencySketch()
+        for _ in range(3):
+            sketch.increment("popular")
+        sketch.increment("rare")
+
+        assert sketch.estimate("popular") >= 3
+        assert sketch.estimate("popular") > sketch.estimate("rare")
+        assert sketch.estimate("unseen") <= sketch.estimate("rare")
+
+    def test_counters_saturate(self):
+        """Test that counters stop at the one-byte maximum."""
+        sketch = FrequencySketch(sample_size=10_000)
+        for _ in range(300):
+            sketch.increment("key")
+
+        assert sketch.estimate("key") == 255
+
+    def test_counters_age(self):
+        """Test that counters are halved after each sample period."""
+        sketch = FrequencySketch(width=64, sample_size=8)
+        for _ in range(7):
+            sketch.increment("key")
+        assert sketch.estimate("key") == 7
+
+        sketch.increment("key")
+
+        assert sketch.estimate("key") == 4
+
+    def test_width_must_be_power_of_two(self):
+        """Test that a width that is not a power of two is rejected."""
+        with pytest.raises(ValueError, match="power of two"):
+            FrequencySketch(width=1000)
+
+
 class TestGetCache:
     """Test global cache instance management."""
 
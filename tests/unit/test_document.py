@@ -1,5 +1,7 @@
 """Unit tests for Document model."""
 
+import pickle
+import sys
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -75,6 +77,13 @@ class TestDocumentModel:
         assert "---" not in excerpt
         assert excerpt.startswith("# Header")
 
+    def test_excerpt_frontmatter_closes_on_its_own_line(self, document_with_frontmatter):
+        """Test a "---" inside a frontmatter value does not end the frontmatter."""
+        document_with_frontmatter.content = (
+            "---\ntitle: Before---after\n---\nFirst paragraph.\n\nSecond."
+        )
+        assert document_with_frontmatter.excerpt() == "First paragraph."
+
     def test_excerpt_truncates_long_content(self, document_with_long_content):
         """Test excerpt truncates content longer than max_length."""
         excerpt = document_with_long_content.excerpt(max_length=100)
@@ -123,6 +132,16 @@ class TestDocumentModel:
         assert len(excerpt) <= 14  # Allow for "..." and word boundary
         assert "..." in excerpt or len(excerpt) <= 10
 
+    def test_excerpt_is_memoized_until_content_changes(self, sample_document):
+        """Test excerpts are reused per length and rebuilt after reassigning content."""
+        first = sample_document.excerpt()
+        assert sample_document.excerpt() is first
+        assert sample_document.excerpt(max_length=3) == "#..."
+
+        sample_document.content = "New opening.\n\nMore text."
+
+        assert sample_document.excerpt() == "New opening."
+
     def test_breadcrumbs_property(self):
         """Test breadcrumbs property returns path components."""
         doc = Document(
@@ -139,7 +158,7 @@ class TestDocumentModel:
             parent=None,
         )
         # Breadcrumbs should be path components excluding the filename
-        assert doc.breadcrumbs == ["guides"]
+        assert doc.breadcrumbs == ("guides",)
 
     def test_breadcrumbs_nested_path(self):
         """Test breadcrumbs with nested directory structure."""
@@ -156,7 +175,7 @@ class TestDocumentModel:
             size_bytes=7,
             parent=None,
         )
-        assert doc.breadcrumbs == ["api", "v1", "endpoints"]
+        assert doc.breadcrumbs == ("api", "v1", "endpoints")
 
     def test_breadcrumbs_root_level(self):
         """Test breadcrumbs for root-level document."""
@@ -173,4 +192,54 @@ class TestDocumentModel:
             size_bytes=8,
             parent=None,
         )
-        assert doc.breadcrumbs == []
+        assert doc.breadcrumbs == ()
+
+    def test_breadcrumbs_are_memoized_until_path_changes(self, sample_document):
+        """Test breadcrumbs are built once and rebuilt after reassigning the path."""
+        sample_document.relative_path = Path("guides/test.md")
+        first = sample_document.breadcrumbs
+        assert sample_document.breadcrumbs is first
+
+        sample_document.relative_path = Path("api/v1/test.md")
+
+        assert sample_document.breadcrumbs == ("api", "v1")
+
+    def test_last_modified_iso_follows_reassignment(self, sample_document):
+        """Test the ISO timestamp is formatted once and refreshed after reassignment."""
+        first = sample_document.last_modified_iso
+        assert first == sample_document.last_modified.isoformat()
+        assert sample_document.last_modified_iso is first
+
+        sample_document.last_modified = datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+        assert sample_document.last_modified_iso == "2024-01-01T12:00:00+00:00"
+
+    def test_uri_and_category_are_interned(self):
+        """Test lookup keys are interned so dict lookups compare by identity."""
+        doc = Document(
+            file_path=Path("/docs/guides/intro.md"),
+            relative_path=Path("guides/intro.md"),
+            title="Intro",
+            content="# Intro",
+            uri="".join(["docs://guides/", "intro"]),
+            category="".join(["gui", "des"]),
+            tags=[],
+            frontmatter={},
+            last_modified=datetime.now(timezone.utc),
+            size_bytes=7,
+            parent=None,
+        )
+        assert doc.uri is sys.intern("docs://guides/intro")
+        assert doc.category is sys.intern("guides")
+
+    def test_lookup_keys_interned_without_validation(self, sample_document):
+        """Test documents that skip validation (constructed or unpickled) still intern keys."""
+        constructed = Document.model_construct(
+            **(sample_document.__dict__ | {"category": "".join(["gui", "des"])})
+        )
+        unpickled = pickle.loads(pickle.dumps(sample_document))
+
+        assert constructed.category is sys.intern("guides")
+        for doc in (constructed, unpickled):
+            assert doc.uri is sample_document.uri
+        assert unpickled.category is sample_document.category
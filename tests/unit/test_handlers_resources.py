@@ -181,6 +181,24 @@ class TestHandleResourceRead:
 
         assert result["metadata"]["tags"] == ["tag1", "tag2", "tag3"]
 
+    @pytest.mark.asyncio
+    async def test_read_document_returns_independent_payloads(self, sample_documents):
+        """Test each read builds a fresh payload from the current document."""
+        uri = "docs://guides/getting-started"
+
+        first = await handle_resource_read(uri, sample_documents, {})
+        first["text"] = "mutated by a caller"
+        second = await handle_resource_read(uri, sample_documents, {})
+
+        assert second is not first
+        assert second["text"] == sample_documents[0].content
+
+        # Same URI and mtime, but a freshly parsed document object
+        reparsed = sample_documents[0].model_copy(update={"content": "# Edited"})
+        third = await handle_resource_read(uri, [reparsed], {})
+
+        assert third["text"] == "# Edited"
+
     @pytest.mark.asyncio
     async def test_read_category_content_format(self, sample_documents, sample_categories):
         """Test category content is formatted correctly."""
@@ -330,6 +348,16 @@ class TestListResources:
         assert root_resource["mimeType"] == "text/markdown"
         assert "description" in root_resource
 
+    @pytest.mark.asyncio
+    async def test_list_resources_root_entry_not_shared(self, sample_documents, sample_categories):
+        """Test mutating one listing's root entry does not leak into later listings."""
+        first = await list_resources(sample_documents, sample_categories)
+        first[0]["name"] = "mutated by a caller"
+
+        second = await list_resources(sample_documents, sample_categories)
+
+        assert second[0]["name"] == "Documentation Root"
+
     @pytest.mark.asyncio
     async def test_list_resources_includes_categories(self, sample_documents, sample_categories):
         """Test list_resources includes all categories."""
@@ -1,12 +1,16 @@
 """Unit tests for MCP tool handlers."""
 
 from datetime import datetime, timezone
-from unittest.mock import AsyncMock, MagicMock, patch
+from functools import partial
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
+import pytest_asyncio
 
 from docs_mcp.core.models.document import Document
 from docs_mcp.core.models.navigation import Category
+from docs_mcp.mcp.handlers import tools
 from docs_mcp.mcp.handlers.tools import (
     handle_generate_pdf_release,
     handle_get_all_tags,
@@ -17,39 +21,75 @@ from docs_mcp.mcp.handlers.tools import (
     handle_search_documentation,
 )
 
+# Fixed modification time so the shared fixtures are plain constants
+_FIXED_TIMESTAMP = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+# Keys every search tool returns for each result
+_SEARCH_RESULT_KEYS = frozenset({"uri", "title", "excerpt", "breadcrumbs", "category"})
+
+# Keys handle_navigate_to returns for a navigation context
+_NAVIGATION_KEYS = frozenset(
+    {
+        "current_uri",
+        "current_type",
+        "parent_uri",
+        "breadcrumbs",
+        "children",
+        "sibling_count",
+        "navigation_options",
+    }
+)
+
+
+def _document(uri: str, **fields: Any) -> Document:
+    """Build a Document for uri, deriving its paths and defaulting the other fields."""
+    path = uri.removeprefix("docs://")
+    defaults: dict[str, Any] = {
+        "title": "Test",
+        "content": "Test content",
+        "file_path": f"/docs/{path}.md",
+        "relative_path": f"docs/{path}.md",
+        "size_bytes": 100,
+        "last_modified": _FIXED_TIMESTAMP,
+    }
+    return Document(uri=uri, **(defaults | fields))
+
+
+def _raise_injected_failure(*args: Any, **kwargs: Any) -> None:
+    """Stand in for a handler dependency that fails."""
+    raise Exception("Injected failure")
+
+
+def _assert_search_result_shape(result: dict[str, Any], *extra_keys: str) -> None:
+    """Assert a search result entry has the keys every search tool returns, plus extra_keys."""
+    missing = _SEARCH_RESULT_KEYS.union(extra_keys) - result.keys()
+    assert not missing, f"missing {sorted(missing)} in search result"
+
 
 class TestHandleSearchDocumentation:
     """Test handle_search_documentation function."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def sample_documents(self):
         """Create sample documents for testing."""
         return [
-            Document(
-                uri="docs://guides/getting-started",
+            _document(
+                "docs://guides/getting-started",
                 title="Getting Started",
                 content="Introduction to the system",
                 category="guides",
                 tags=["tutorial"],
-                file_path="/docs/guides/getting-started.md",
-                relative_path="docs/guides/getting-started.md",
-                size_bytes=100,
-                last_modified=datetime.now(timezone.utc),
             ),
-            Document(
-                uri="docs://api/authentication",
+            _document(
+                "docs://api/authentication",
                 title="Authentication",
                 content="API authentication details",
                 category="api",
                 tags=["security"],
-                file_path="/docs/api/authentication.md",
-                relative_path="docs/api/authentication.md",
-                size_bytes=100,
-                last_modified=datetime.now(timezone.utc),
             ),
         ]
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def sample_categories(self):
         """Create sample categories for testing."""
         return {
@@ -65,39 +105,28 @@ class TestHandleSearchDocumentation:
             )
         }
 
-    @pytest.mark.asyncio
-    async def test_search_with_query(self, sample_documents, sample_categories):
-        """Test searching with a query string."""
-        arguments = {"query": "authentication"}
-
-        results = await handle_search_documentation(
-            arguments, sample_documents, sample_categories, search_limit=10
+    @pytest_asyncio.fixture(scope="class")
+    async def authentication_results(self, sample_documents, sample_categories):
+        """Search for "authentication" once for the tests that only inspect the results."""
+        return await handle_search_documentation(
+            {"query": "authentication"}, sample_documents, sample_categories, search_limit=10
         )
 
+    async def test_search_with_query(self, authentication_results):
+        """Test searching with a query string."""
+        results = authentication_results
+
         assert isinstance(results, list)
         assert len(results) > 0
         assert all("uri" in r for r in results)
 
-    @pytest.mark.asyncio
-    async def test_search_result_format(self, sample_documents, sample_categories):
+    async def test_search_result_format(self, authentication_results):
         """Test search results have correct format."""
-        arguments = {"query": "authentication"}
-
-        results = await handle_search_documentation(
-            arguments, sample_documents, sample_categories, search_limit=10
-        )
+        results = authentication_results
 
         assert len(results) > 0
-        result = results[0]
-        assert "uri" in result
-        assert "title" in result
-        assert "excerpt" in result
-        assert "breadcrumbs" in result
-        assert "category" in result
-        assert "relevance" in result
-        assert "match_type" in result
-
-    @pytest.mark.asyncio
+        _assert_search_result_shape(results[0], "relevance", "match_type")
+
     async def test_search_with_category_filter(self, sample_documents, sample_categories):
         """Test searching with category filter."""
         arguments = {"query": "guide", "category": "guides"}
@@ -108,7 +137,6 @@ class TestHandleSearchDocumentation:
 
         assert isinstance(results, list)
 
-    @pytest.mark.asyncio
     async def test_search_with_limit(self, sample_documents, sample_categories):
         """Test searching with result limit."""
         arguments = {"query": "api", "limit": 1}
@@ -119,23 +147,23 @@ class TestHandleSearchDocumentation:
 
         assert len(results) <= 1
 
-    @pytest.mark.asyncio
-    async def test_search_uses_default_limit(self, sample_documents, sample_categories):
+    async def test_search_uses_default_limit(
+        self, sample_documents, sample_categories, monkeypatch
+    ):
         """Test search uses default limit when not specified."""
         arguments = {"query": "test"}
 
-        with patch("docs_mcp.mcp.handlers.tools.search_content") as mock_search:
-            mock_search.return_value = []
-            await handle_search_documentation(
-                arguments, sample_documents, sample_categories, search_limit=5
-            )
+        mock_search = Mock(return_value=[])
+        monkeypatch.setattr(tools, "search_content", mock_search)
+        await handle_search_documentation(
+            arguments, sample_documents, sample_categories, search_limit=5
+        )
 
-            # Should use search_limit parameter as default
-            assert mock_search.called
-            call_kwargs = mock_search.call_args.kwargs
-            assert call_kwargs["limit"] == 5
+        # Should use search_limit parameter as default
+        assert mock_search.called
+        call_kwargs = mock_search.call_args.kwargs
+        assert call_kwargs["limit"] == 5
 
-    @pytest.mark.asyncio
     async def test_search_with_empty_query(self, sample_documents, sample_categories):
         """Test searching with empty query."""
         arguments = {"query": ""}
@@ -146,7 +174,6 @@ class TestHandleSearchDocumentation:
 
         assert isinstance(results, list)
 
-    @pytest.mark.asyncio
     async def test_search_with_missing_query(self, sample_documents, sample_categories):
         """Test searching without query parameter."""
         arguments = {}
@@ -157,44 +184,23 @@ class TestHandleSearchDocumentation:
 
         assert isinstance(results, list)
 
-    @pytest.mark.asyncio
-    async def test_search_handles_exception(self, sample_documents, sample_categories):
-        """Test search handles exceptions gracefully."""
-        arguments = {"query": "test"}
-
-        with patch("docs_mcp.mcp.handlers.tools.search_content") as mock_search:
-            mock_search.side_effect = Exception("Search error")
-
-            results = await handle_search_documentation(
-                arguments, sample_documents, sample_categories, search_limit=10
-            )
-
-            assert isinstance(results, list)
-            assert len(results) > 0
-            assert "error" in results[0]
-
 
 class TestHandleNavigateTo:
     """Test handle_navigate_to function."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def sample_documents(self):
         """Create sample documents for testing."""
         return [
-            Document(
-                uri="docs://guides/getting-started",
+            _document(
+                "docs://guides/getting-started",
                 title="Getting Started",
                 content="Introduction",
                 category="guides",
-                tags=[],
-                file_path="/docs/guides/getting-started.md",
-                relative_path="docs/guides/getting-started.md",
-                size_bytes=100,
-                last_modified=datetime.now(timezone.utc),
             )
         ]
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def sample_categories(self):
         """Create sample categories for testing."""
         return {
@@ -220,36 +226,15 @@ class TestHandleNavigateTo:
             ),
         }
 
-    @pytest.mark.asyncio
     async def test_navigate_to_uri(self, sample_documents, sample_categories):
-        """Test navigating to a URI."""
+        """Test navigating to a URI returns a correctly formatted context."""
         arguments = {"uri": "docs://guides"}
 
         result = await handle_navigate_to(arguments, sample_documents, sample_categories)
 
-        assert "current_uri" in result
         assert result["current_uri"] == "docs://guides"
-        assert "current_type" in result
-        assert "parent_uri" in result
-        assert "breadcrumbs" in result
-        assert "children" in result
-
-    @pytest.mark.asyncio
-    async def test_navigate_result_format(self, sample_documents, sample_categories):
-        """Test navigation result has correct format."""
-        arguments = {"uri": "docs://guides"}
-
-        result = await handle_navigate_to(arguments, sample_documents, sample_categories)
-
-        assert "current_uri" in result
-        assert "current_type" in result
-        assert "parent_uri" in result
-        assert "breadcrumbs" in result
-        assert "children" in result
-        assert "sibling_count" in result
-        assert "navigation_options" in result
+        assert not _NAVIGATION_KEYS - result.keys()
 
-    @pytest.mark.asyncio
     async def test_navigate_with_empty_uri(self, sample_documents, sample_categories):
         """Test navigating with empty URI."""
         arguments = {"uri": ""}
@@ -259,7 +244,6 @@ class TestHandleNavigateTo:
         # Should default to root or handle gracefully
         assert isinstance(result, dict)
 
-    @pytest.mark.asyncio
     async def test_navigate_with_missing_uri(self, sample_documents, sample_categories):
         """Test navigating without URI parameter."""
         arguments = {}
@@ -268,41 +252,23 @@ class TestHandleNavigateTo:
 
         assert isinstance(result, dict)
 
-    @pytest.mark.asyncio
-    async def test_navigate_handles_exception(self, sample_documents, sample_categories):
-        """Test navigation handles exceptions gracefully."""
-        arguments = {"uri": "docs://invalid"}
-
-        with patch("docs_mcp.mcp.handlers.tools.navigate_to_uri") as mock_navigate:
-            mock_navigate.side_effect = Exception("Navigation error")
-
-            result = await handle_navigate_to(arguments, sample_documents, sample_categories)
-
-            assert "error" in result
-            assert "Navigation error" in result["error"]
-
 
 class TestHandleGetTableOfContents:
     """Test handle_get_table_of_contents function."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def sample_documents(self):
         """Create sample documents for testing."""
         return [
-            Document(
-                uri="docs://guides/getting-started",
+            _document(
+                "docs://guides/getting-started",
                 title="Getting Started",
                 content="Introduction",
                 category="guides",
-                tags=[],
-                file_path="/docs/guides/getting-started.md",
-                relative_path="docs/guides/getting-started.md",
-                size_bytes=100,
-                last_modified=datetime.now(timezone.utc),
             )
         ]
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def sample_categories(self):
         """Create sample categories for testing."""
         return {
@@ -318,81 +284,37 @@ class TestHandleGetTableOfContents:
             )
         }
 
-    @pytest.mark.asyncio
-    async def test_get_table_of_contents(self, sample_documents, sample_categories):
-        """Test getting table of contents."""
-        arguments = {}
-
+    @pytest.mark.parametrize("arguments", [{}, {"max_depth": 2}], ids=["default", "max_depth"])
+    async def test_get_table_of_contents(self, sample_documents, sample_categories, arguments):
+        """Test getting table of contents with and without max_depth."""
         result = await handle_get_table_of_contents(arguments, sample_documents, sample_categories)
 
         assert isinstance(result, dict)
 
-    @pytest.mark.asyncio
-    async def test_get_toc_with_max_depth(self, sample_documents, sample_categories):
-        """Test getting table of contents with max_depth."""
-        arguments = {"max_depth": 2}
-
-        result = await handle_get_table_of_contents(arguments, sample_documents, sample_categories)
-
-        assert isinstance(result, dict)
-
-    @pytest.mark.asyncio
-    async def test_get_toc_without_max_depth(self, sample_documents, sample_categories):
-        """Test getting table of contents without max_depth."""
-        arguments = {}
-
-        result = await handle_get_table_of_contents(arguments, sample_documents, sample_categories)
-
-        assert isinstance(result, dict)
-
-    @pytest.mark.asyncio
-    async def test_get_toc_handles_exception(self, sample_documents, sample_categories):
-        """Test table of contents handles exceptions gracefully."""
-        arguments = {}
-
-        with patch("docs_mcp.mcp.handlers.tools.get_table_of_contents") as mock_toc:
-            mock_toc.side_effect = Exception("TOC error")
-
-            result = await handle_get_table_of_contents(
-                arguments, sample_documents, sample_categories
-            )
-
-            assert "error" in result
-            assert "TOC error" in result["error"]
-
 
 class TestHandleSearchByTags:
     """Test handle_search_by_tags function."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def sample_documents(self):
         """Create sample documents for testing."""
         return [
-            Document(
-                uri="docs://guides/getting-started",
+            _document(
+                "docs://guides/getting-started",
                 title="Getting Started",
                 content="Introduction",
                 category="guides",
                 tags=["tutorial", "beginner"],
-                file_path="/docs/guides/getting-started.md",
-                relative_path="docs/guides/getting-started.md",
-                size_bytes=100,
-                last_modified=datetime.now(timezone.utc),
             ),
-            Document(
-                uri="docs://api/authentication",
+            _document(
+                "docs://api/authentication",
                 title="Authentication",
                 content="API docs",
                 category="api",
                 tags=["security", "api"],
-                file_path="/docs/api/authentication.md",
-                relative_path="docs/api/authentication.md",
-                size_bytes=100,
-                last_modified=datetime.now(timezone.utc),
             ),
         ]
 
-    @pytest.mark.asyncio
     async def test_search_by_tags(self, sample_documents):
         """Test searching by tags."""
         arguments = {"tags": ["tutorial"]}
@@ -402,7 +324,6 @@ class TestHandleSearchByTags:
         assert isinstance(results, list)
         assert len(results) > 0
 
-    @pytest.mark.asyncio
     async def test_search_by_tags_result_format(self, sample_documents):
         """Test search by tags result format."""
         arguments = {"tags": ["tutorial"]}
@@ -410,15 +331,8 @@ class TestHandleSearchByTags:
         results = await handle_search_by_tags(arguments, sample_documents, search_limit=10)
 
         assert len(results) > 0
-        result = results[0]
-        assert "uri" in result
-        assert "title" in result
-        assert "excerpt" in result
-        assert "breadcrumbs" in result
-        assert "category" in result
-        assert "tags" in result
+        _assert_search_result_shape(results[0], "tags")
 
-    @pytest.mark.asyncio
     async def test_search_by_tags_with_category(self, sample_documents):
         """Test searching by tags with category filter."""
         arguments = {"tags": ["tutorial"], "category": "guides"}
@@ -427,7 +341,6 @@ class TestHandleSearchByTags:
 
         assert isinstance(results, list)
 
-    @pytest.mark.asyncio
     async def test_search_by_tags_with_limit(self, sample_documents):
         """Test searching by tags with limit."""
         arguments = {"tags": ["tutorial"], "limit": 1}
@@ -436,20 +349,18 @@ class TestHandleSearchByTags:
 
         assert len(results) <= 1
 
-    @pytest.mark.asyncio
-    async def test_search_by_tags_uses_default_limit(self, sample_documents):
+    async def test_search_by_tags_uses_default_limit(self, sample_documents, monkeypatch):
         """Test search by tags uses default limit."""
         arguments = {"tags": ["tutorial"]}
 
-        with patch("docs_mcp.mcp.handlers.tools.search_by_metadata") as mock_search:
-            mock_search.return_value = []
-            await handle_search_by_tags(arguments, sample_documents, search_limit=5)
+        mock_search = Mock(return_value=[])
+        monkeypatch.setattr(tools, "search_by_metadata", mock_search)
+        await handle_search_by_tags(arguments, sample_documents, search_limit=5)
 
-            assert mock_search.called
-            call_kwargs = mock_search.call_args.kwargs
-            assert call_kwargs["limit"] == 5
+        assert mock_search.called
+        call_kwargs = mock_search.call_args.kwargs
+        assert call_kwargs["limit"] == 5
 
-    @pytest.mark.asyncio
     async def test_search_by_empty_tags(self, sample_documents):
         """Test searching with empty tags list."""
         arguments = {"tags": []}
@@ -458,7 +369,6 @@ class TestHandleSearchByTags:
 
         assert isinstance(results, list)
 
-    @pytest.mark.asyncio
     async def test_search_by_tags_missing_parameter(self, sample_documents):
         """Test searching without tags parameter."""
         arguments = {}
@@ -467,64 +377,32 @@ class TestHandleSearchByTags:
 
         assert isinstance(results, list)
 
-    @pytest.mark.asyncio
-    async def test_search_by_tags_handles_exception(self, sample_documents):
-        """Test search by tags handles exceptions gracefully."""
-        arguments = {"tags": ["test"]}
-
-        with patch("docs_mcp.mcp.handlers.tools.search_by_metadata") as mock_search:
-            mock_search.side_effect = Exception("Tag search error")
-
-            results = await handle_search_by_tags(arguments, sample_documents, search_limit=10)
-
-            assert isinstance(results, list)
-            assert len(results) > 0
-            assert "error" in results[0]
-
 
 class TestHandleGetDocument:
     """Test handle_get_document function."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def sample_documents(self):
         """Create sample documents for testing."""
         return [
-            Document(
-                uri="docs://guides/getting-started",
+            _document(
+                "docs://guides/getting-started",
                 title="Getting Started",
                 content="# Getting Started\n\nIntroduction to the system.",
                 category="guides",
                 tags=["tutorial", "beginner"],
-                file_path="/docs/guides/getting-started.md",
-                relative_path="docs/guides/getting-started.md",
-                size_bytes=100,
                 last_modified=datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc),
             )
         ]
 
-    @pytest.mark.asyncio
-    async def test_get_document(self, sample_documents):
-        """Test getting a document."""
-        arguments = {"uri": "docs://guides/getting-started"}
+    @pytest_asyncio.fixture(scope="class")
+    async def getting_started(self, sample_documents):
+        """Fetch the getting-started document once for the tests that only inspect it."""
+        return await handle_get_document({"uri": "docs://guides/getting-started"}, sample_documents)
 
-        result = await handle_get_document(arguments, sample_documents)
-
-        assert "uri" in result
-        assert result["uri"] == "docs://guides/getting-started"
-        assert "title" in result
-        assert result["title"] == "Getting Started"
-        assert "content" in result
-        assert "tags" in result
-        assert "category" in result
-        assert "last_modified" in result
-        assert "breadcrumbs" in result
-
-    @pytest.mark.asyncio
-    async def test_get_document_includes_all_fields(self, sample_documents):
-        """Test get document includes all required fields."""
-        arguments = {"uri": "docs://guides/getting-started"}
-
-        result = await handle_get_document(arguments, sample_documents)
+    async def test_get_document(self, getting_started):
+        """Test getting a document returns all of its fields."""
+        result = getting_started
 
         assert result["uri"] == "docs://guides/getting-started"
         assert result["title"] == "Getting Started"
@@ -534,7 +412,15 @@ class TestHandleGetDocument:
         assert result["last_modified"] == "2024-01-01T12:00:00+00:00"
         assert isinstance(result["breadcrumbs"], list)
 
-    @pytest.mark.asyncio
+    async def test_get_document_with_uri_index(self, sample_documents, getting_started):
+        """Test getting a document from a prebuilt URI index."""
+        arguments = {"uri": "docs://guides/getting-started"}
+        documents_by_uri = {doc.uri: doc for doc in sample_documents}
+
+        result = await handle_get_document(arguments, documents_by_uri)
+
+        assert result == getting_started
+
     async def test_get_document_not_found(self, sample_documents):
         """Test getting a non-existent document."""
         arguments = {"uri": "docs://nonexistent"}
@@ -544,7 +430,6 @@ class TestHandleGetDocument:
         assert "error" in result
         assert "not found" in result["error"].lower()
 
-    @pytest.mark.asyncio
     async def test_get_document_with_empty_uri(self, sample_documents):
         """Test getting document with empty URI."""
         arguments = {"uri": ""}
@@ -553,7 +438,6 @@ class TestHandleGetDocument:
 
         assert "error" in result
 
-    @pytest.mark.asyncio
     async def test_get_document_without_uri(self, sample_documents):
         """Test getting document without URI parameter."""
         arguments = {}
@@ -562,137 +446,73 @@ class TestHandleGetDocument:
 
         assert "error" in result
 
-    @pytest.mark.asyncio
-    async def test_get_document_handles_exception(self, sample_documents):
-        """Test get document handles exceptions gracefully."""
-        arguments = {"uri": "docs://test"}
-
-        with patch("docs_mcp.mcp.handlers.tools.logger"):
-            # Simulate exception by making sample_documents invalid
-            result = await handle_get_document(arguments, None)
-
-            assert "error" in result
-
-    @pytest.mark.asyncio
-    async def test_get_document_breadcrumbs_format(self, sample_documents):
-        """Test get document returns breadcrumbs as list."""
-        arguments = {"uri": "docs://guides/getting-started"}
-
-        result = await handle_get_document(arguments, sample_documents)
-
-        assert isinstance(result["breadcrumbs"], list)
-
-    @pytest.mark.asyncio
-    async def test_get_document_with_multiple_tags(self):
-        """Test getting document with multiple tags."""
-        documents = [
-            Document(
-                uri="docs://test",
-                title="Test",
-                content="Test content",
-                category="test",
-                tags=["tag1", "tag2", "tag3"],
-                file_path="/test.md",
-                relative_path="test.md",
-                size_bytes=100,
-                last_modified=datetime.now(timezone.utc),
-            )
-        ]
-
-        arguments = {"uri": "docs://test"}
-        result = await handle_get_document(arguments, documents)
-
-        assert result["tags"] == ["tag1", "tag2", "tag3"]
-
-    @pytest.mark.asyncio
-    async def test_get_document_with_no_tags(self):
-        """Test getting document with no tags."""
-        documents = [
-            Document(
-                uri="docs://test",
-                title="Test",
-                content="Test content",
-                category="test",
-                tags=[],
-                file_path="/test.md",
-                relative_path="test.md",
-                size_bytes=100,
-                last_modified=datetime.now(timezone.utc),
-            )
-        ]
+    @pytest.mark.parametrize("tags", [["tag1", "tag2", "tag3"], []])
+    async def test_get_document_tag_variants(self, tags):
+        """Test getting a document returns its tags, whether several or none."""
+        documents = [_document("docs://test", category="test", tags=tags)]
 
-        arguments = {"uri": "docs://test"}
-        result = await handle_get_document(arguments, documents)
+        result = await handle_get_document({"uri": "docs://test"}, documents)
 
-        assert result["tags"] == []
+        assert result["tags"] == tags
 
 
 class TestHandleGetAllTags:
     """Test handle_get_all_tags function."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def sample_documents(self):
         """Create sample documents for testing."""
         return [
-            Document(
-                uri="docs://guides/getting-started",
+            _document(
+                "docs://guides/getting-started",
                 title="Getting Started",
                 content="Introduction",
                 category="guides",
                 tags=["tutorial", "beginner"],
-                file_path="/docs/guides/getting-started.md",
-                relative_path="docs/guides/getting-started.md",
-                size_bytes=100,
-                last_modified=datetime.now(timezone.utc),
             ),
-            Document(
-                uri="docs://api/authentication",
+            _document(
+                "docs://api/authentication",
                 title="Authentication",
                 content="API docs",
                 category="api",
                 tags=["security", "api", "tutorial"],
-                file_path="/docs/api/authentication.md",
-                relative_path="docs/api/authentication.md",
-                size_bytes=100,
-                last_modified=datetime.now(timezone.utc),
             ),
-            Document(
-                uri="docs://api/authorization",
+            _document(
+                "docs://api/authorization",
                 title="Authorization",
                 content="Authorization docs",
                 category="api",
                 tags=["security", "api"],
-                file_path="/docs/api/authorization.md",
-                relative_path="docs/api/authorization.md",
-                size_bytes=100,
-                last_modified=datetime.now(timezone.utc),
             ),
         ]
 
-    @pytest.mark.asyncio
-    async def test_get_all_tags(self, sample_documents):
-        """Test getting all unique tags."""
-        arguments = {}
+    @pytest_asyncio.fixture(scope="class")
+    async def all_tags(self, sample_documents):
+        """List every tag once for the tests that only inspect the default result."""
+        return await handle_get_all_tags({}, sample_documents)
 
-        result = await handle_get_all_tags(arguments, sample_documents)
+    @pytest_asyncio.fixture(scope="class")
+    async def all_tag_counts(self, sample_documents):
+        """List every tag with document counts once for the tests that inspect them."""
+        return await handle_get_all_tags({"include_counts": True}, sample_documents)
+
+    async def test_get_all_tags(self, all_tags):
+        """Test getting all unique tags."""
+        result = all_tags
 
         assert "tags" in result
         assert "count" in result
         assert isinstance(result["tags"], list)
         # Should have 4 unique tags: api, beginner, security, tutorial
         assert result["count"] == 4
-        assert sorted(result["tags"]) == ["api", "beginner", "security", "tutorial"]
+        assert set(result["tags"]) == {"api", "beginner", "security", "tutorial"}
 
-    @pytest.mark.asyncio
-    async def test_get_all_tags_sorted_alphabetically(self, sample_documents):
+    async def test_get_all_tags_sorted_alphabetically(self, all_tags):
         """Test tags are sorted alphabetically."""
-        arguments = {}
-
-        result = await handle_get_all_tags(arguments, sample_documents)
+        result = all_tags
 
         assert result["tags"] == sorted(result["tags"])
 
-    @pytest.mark.asyncio
     async def test_get_all_tags_with_category_filter(self, sample_documents):
         """Test filtering tags by category."""
         arguments = {"category": "api"}
@@ -700,18 +520,13 @@ class TestHandleGetAllTags:
         result = await handle_get_all_tags(arguments, sample_documents)
 
         # Only api and security tags from api category (tutorial appears in api too)
-        assert "tags" in result
-        assert "api" in result["tags"]
-        assert "security" in result["tags"]
-        assert "tutorial" in result["tags"]
-        assert "beginner" not in result["tags"]
+        tags = set(result["tags"])
+        assert tags.issuperset({"api", "security", "tutorial"})
+        assert "beginner" not in tags
 
-    @pytest.mark.asyncio
-    async def test_get_all_tags_with_include_counts(self, sample_documents):
+    async def test_get_all_tags_with_include_counts(self, all_tag_counts):
         """Test including document counts per tag."""
-        arguments = {"include_counts": True}
-
-        result = await handle_get_all_tags(arguments, sample_documents)
+        result = all_tag_counts
 
         assert "tags" in result
         assert "count" in result
@@ -723,12 +538,9 @@ class TestHandleGetAllTags:
             assert "tag" in item
             assert "document_count" in item
 
-    @pytest.mark.asyncio
-    async def test_get_all_tags_counts_are_correct(self, sample_documents):
+    async def test_get_all_tags_counts_are_correct(self, all_tag_counts):
         """Test document counts are accurate."""
-        arguments = {"include_counts": True}
-
-        result = await handle_get_all_tags(arguments, sample_documents)
+        result = all_tag_counts
 
         tag_counts_dict = {item["tag"]: item["document_count"] for item in result["tag_counts"]}
 
@@ -741,7 +553,6 @@ class TestHandleGetAllTags:
         # beginner appears in 1 doc
         assert tag_counts_dict["beginner"] == 1
 
-    @pytest.mark.asyncio
     async def test_get_all_tags_without_counts(self, sample_documents):
         """Test tag_counts is not included when include_counts is false."""
         arguments = {"include_counts": False}
@@ -752,7 +563,6 @@ class TestHandleGetAllTags:
         assert "count" in result
         assert "tag_counts" not in result
 
-    @pytest.mark.asyncio
     async def test_get_all_tags_with_category_and_counts(self, sample_documents):
         """Test combining category filter with counts."""
         arguments = {"category": "guides", "include_counts": True}
@@ -766,7 +576,6 @@ class TestHandleGetAllTags:
         assert "beginner" in tag_names
         assert "api" not in tag_names
 
-    @pytest.mark.asyncio
     async def test_get_all_tags_empty_documents(self):
         """Test with empty document list."""
         arguments = {}
@@ -776,7 +585,6 @@ class TestHandleGetAllTags:
         assert result["tags"] == []
         assert result["count"] == 0
 
-    @pytest.mark.asyncio
     async def test_get_all_tags_no_matching_category(self, sample_documents):
         """Test with category that has no documents."""
         arguments = {"category": "nonexistent"}
@@ -786,22 +594,9 @@ class TestHandleGetAllTags:
         assert result["tags"] == []
         assert result["count"] == 0
 
-    @pytest.mark.asyncio
     async def test_get_all_tags_documents_without_tags(self):
         """Test with documents that have no tags."""
-        documents = [
-            Document(
-                uri="docs://test",
-                title="Test",
-                content="Test content",
-                category="test",
-                tags=[],
-                file_path="/test.md",
-                relative_path="test.md",
-                size_bytes=100,
-                last_modified=datetime.now(timezone.utc),
-            )
-        ]
+        documents = [_document("docs://test", category="test")]
 
         arguments = {}
         result = await handle_get_all_tags(arguments, documents)
@@ -809,15 +604,52 @@ class TestHandleGetAllTags:
         assert result["tags"] == []
         assert result["count"] == 0
 
-    @pytest.mark.asyncio
-    async def test_get_all_tags_handles_exception(self):
-        """Test get all tags handles exceptions gracefully."""
-        arguments = {}
 
-        # Pass None to trigger exception
-        result = await handle_get_all_tags(arguments, None)  # type: ignore
+class TestHandlerExceptions:
+    """Test every query tool handler turns internal failures into an error result."""
 
-        assert "error" in result
+    @pytest.mark.parametrize(
+        ("call", "patch_target"),
+        [
+            pytest.param(
+                partial(handle_search_documentation, {"query": "test"}, [], {}, search_limit=10),
+                "search_content",
+                id="search_documentation",
+            ),
+            pytest.param(
+                partial(handle_navigate_to, {"uri": "docs://invalid"}, [], {}),
+                "navigate_to_uri",
+                id="navigate_to",
+            ),
+            pytest.param(
+                partial(handle_get_table_of_contents, {}, [], {}),
+                "get_table_of_contents",
+                id="get_table_of_contents",
+            ),
+            pytest.param(
+                partial(handle_search_by_tags, {"tags": ["test"]}, [], search_limit=10),
+                "search_by_metadata",
+                id="search_by_tags",
+            ),
+            # No dependency to patch: invalid documents make these fail
+            pytest.param(
+                partial(handle_get_document, {"uri": "docs://test"}, None), None, id="get_document"
+            ),
+            pytest.param(partial(handle_get_all_tags, {}, None), None, id="get_all_tags"),
+        ],
+    )
+    async def test_handler_reports_exception(self, call, patch_target, monkeypatch):
+        """Test a failing handler returns an error entry instead of raising."""
+        if patch_target is not None:
+            monkeypatch.setattr(tools, patch_target, _raise_injected_failure)
+
+        result = await call()
+
+        # List-returning handlers report the error as their only entry
+        error = result[0] if isinstance(result, list) else result
+        assert "error" in error
+        if patch_target is not None:
+            assert "Injected failure" in error["error"]
 
 
 class TestHandleGeneratePdfRelease:
@@ -835,7 +667,6 @@ class TestHandleGeneratePdfRelease:
         script_path.chmod(0o755)
         return docs_root
 
-    @pytest.mark.asyncio
     async def test_generate_pdf_with_all_metadata(self, mock_docs_root):
         """Test generating PDF with all metadata fields."""
         arguments = {
@@ -860,7 +691,6 @@ class TestHandleGeneratePdfRelease:
             assert "output_file" in result
             assert "manifest_file" in result
 
-    @pytest.mark.asyncio
     async def test_generate_pdf_with_minimal_arguments(self, mock_docs_root):
         """Test generating PDF with minimal arguments (only version)."""
         arguments = {"version": "2.0.0"}
@@ -875,7 +705,6 @@ class TestHandleGeneratePdfRelease:
 
             assert result["success"] is True
 
-    @pytest.mark.asyncio
     async def test_generate_pdf_default_version(self, mock_docs_root):
         """Test generating PDF without version (uses current date)."""
         arguments = {"title": "My Docs"}
@@ -892,7 +721,6 @@ class TestHandleGeneratePdfRelease:
             # Should use default version (current date)
             assert "output_file" in result
 
-    @pytest.mark.asyncio
     async def test_generate_pdf_subtitle_included_in_command(self, mock_docs_root):
         """Test that subtitle parameter is properly passed to script."""
         arguments = {
@@ -916,7 +744,6 @@ class TestHandleGeneratePdfRelease:
             assert "--subtitle" in cmd
             assert "Technical Guide" in cmd
 
-    @pytest.mark.asyncio
     async def test_generate_pdf_confidential_flag(self, mock_docs_root):
         """Test that confidential flag is properly passed."""
         arguments = {
@@ -939,7 +766,6 @@ class TestHandleGeneratePdfRelease:
             assert "--owner" in cmd
             assert "ACME Corp" in cmd
 
-    @pytest.mark.asyncio
     async def test_generate_pdf_script_not_found(self, tmp_path):
         """Test error handling when script is not found."""
         docs_root = tmp_path / "docs"
@@ -956,7 +782,6 @@ class TestHandleGeneratePdfRelease:
             assert "error" in result
             assert "script not found" in result["error"].lower()
 
-    @pytest.mark.asyncio
     async def test_generate_pdf_script_execution_failed(self, mock_docs_root):
         """Test error handling when script execution fails."""
         arguments = {"version": "1.0.0"}
@@ -975,7 +800,6 @@ class TestHandleGeneratePdfRelease:
             assert "error" in result
             assert "pdf generation failed" in result["error"].lower()
 
-    @pytest.mark.asyncio
     async def test_generate_pdf_handles_exception(self, mock_docs_root):
         """Test exception handling during PDF generation."""
         arguments = {"version": "1.0.0"}
@@ -989,7 +813,6 @@ class TestHandleGeneratePdfRelease:
             assert "error" in result
             assert "subprocess error" in result["error"].lower()
 
-    @pytest.mark.asyncio
     async def test_generate_pdf_empty_arguments(self, mock_docs_root):
         """Test generating PDF with empty arguments dictionary."""
         arguments = {}
@@ -1005,7 +828,6 @@ class TestHandleGeneratePdfRelease:
             # Should still work with defaults
             assert result["success"] is True
 
-    @pytest.mark.asyncio
     async def test_generate_pdf_command_structure(self, mock_docs_root):
         """Test that command is properly structured with all parameters."""
         arguments = {
@@ -1034,7 +856,6 @@ class TestHandleGeneratePdfRelease:
             # Confidential=False should not add --confidential flag
             assert "--confidential" not in call_args
 
-    @pytest.mark.asyncio
     async def test_generate_pdf_result_format(self, mock_docs_root):
         """Test that result has correct format on success."""
         arguments = {"version": "1.0.0"}
@@ -1054,7 +875,6 @@ class TestHandleGeneratePdfRelease:
             assert result["output_file"] == "/path/to/output.pdf"
             assert result["manifest_file"] == "/path/to/manifest.json"
 
-    @pytest.mark.asyncio
     async def test_generate_pdf_with_special_characters_in_metadata(self, mock_docs_root):
         """Test handling of special characters in metadata fields."""
         arguments = {
@@ -1,30 +1,32 @@
 """Unit tests for hierarchical navigation and category tree building."""
 
+import sys
 from datetime import datetime, timezone
 from pathlib import Path
 
 import pytest
 
 from docs_mcp.core.models.document import Document
-from docs_mcp.core.models.navigation import Category
 from docs_mcp.core.services.hierarchy import (
     HierarchyError,
-    _count_documents_recursive,
+    _breadcrumb_items,
     _get_category_context,
     _get_document_context,
     _get_root_context,
     build_category_tree,
+    build_uri_index,
     get_breadcrumbs,
     get_table_of_contents,
     navigate_to_uri,
 )
 
+# Fixed modification time so the module-scoped documents are plain constants
+_FIXED_TIMESTAMP = datetime(2024, 1, 1, tzinfo=timezone.utc)
 
-@pytest.fixture
-def sample_documents():
-    """Create sample documents for testing."""
-    base_time = datetime.now(timezone.utc)
 
+@pytest.fixture(scope="module")
+def sample_documents():
+    """Create sample documents for testing, once per module (tests only read them)."""
     return [
         Document(
             file_path=Path("/docs/guides/getting-started.md"),
@@ -35,7 +37,7 @@ def sample_documents():
             tags=["tutorial", "beginner"],
             category="guides",
             order=1,
-            last_modified=base_time,
+            last_modified=_FIXED_TIMESTAMP,
             size_bytes=100,
         ),
         Document(
@@ -47,7 +49,7 @@ def sample_documents():
             tags=["advanced", "optimization"],
             category="guides",
             order=2,
-            last_modified=base_time,
+            last_modified=_FIXED_TIMESTAMP,
             size_bytes=200,
         ),
         Document(
@@ -59,7 +61,7 @@ def sample_documents():
             tags=["api", "security"],
             category="api",
             order=1,
-            last_modified=base_time,
+            last_modified=_FIXED_TIMESTAMP,
             size_bytes=150,
         ),
         Document(
@@ -71,7 +73,7 @@ def sample_documents():
             tags=[],
             category=None,
             order=0,
-            last_modified=base_time,
+            last_modified=_FIXED_TIMESTAMP,
             size_bytes=50,
         ),
     ]
@@ -139,6 +141,15 @@ class TestBuildCategoryTree:
         # Should count authentication.md
         assert api.document_count == 1
 
+    def test_category_uris_are_interned(self, sample_documents):
+        """Test category URIs and their parent links are interned strings."""
+        categories = build_category_tree(sample_documents)
+
+        for uri, category in categories.items():
+            assert category.uri is sys.intern(uri)
+            if category.parent_uri is not None:
+                assert category.parent_uri is sys.intern(category.parent_uri)
+
     def test_empty_document_list(self):
         """Test building tree from empty document list."""
         categories = build_category_tree([])
@@ -267,6 +278,18 @@ class TestGetBreadcrumbs:
         assert breadcrumbs[0]["name"] == "Getting Started"
         assert breadcrumbs[1]["name"] == "First Steps"
 
+    def test_breadcrumbs_are_memoized_but_not_shared(self):
+        """Test repeated calls reuse the cached trail and return fresh lists."""
+        uri = "docs://guides/memoized"
+        _breadcrumb_items.cache_clear()
+
+        first = get_breadcrumbs(uri)
+        first[0]["name"] = "Mutated"
+        second = get_breadcrumbs(uri)
+
+        assert second[0]["name"] == "Guides"
+        assert _breadcrumb_items.cache_info().hits == 1
+
 
 class TestNavigateToUri:
     """Test URI navigation."""
@@ -308,6 +331,23 @@ class TestNavigateToUri:
         with pytest.raises(HierarchyError, match="URI not found"):
             navigate_to_uri("docs://nonexistent", sample_documents, categories)
 
+    def test_navigate_to_document_with_uri_index(self, sample_documents):
+        """Test navigating to a document using a prebuilt URI index."""
+        categories = build_category_tree(sample_documents)
+        index = build_uri_index(sample_documents)
+
+        context = navigate_to_uri("docs://api/authentication", index, categories)
+
+        assert context.current_type == "document"
+        assert context.current_uri == "docs://api/authentication"
+
+    def test_build_uri_index(self, sample_documents):
+        """Test URI index maps every document by its URI."""
+        index = build_uri_index(sample_documents)
+
+        assert len(index) == len(sample_documents)
+        assert all(index[doc.uri] is doc for doc in sample_documents)
+
     def test_navigate_to_nested_category(self, sample_documents):
         """Test navigating to nested category."""
         categories = build_category_tree(sample_documents)
@@ -437,69 +477,6 @@ class TestGetTableOfContents:
         assert len(toc1["children"]) == len(toc2["children"])
 
 
-class TestCountDocumentsRecursive:
-    """Test recursive document counting."""
-
-    def test_count_leaf_category(self):
-        """Test counting documents in leaf category."""
-        category = Category(
-            name="leaf",
-            label="Leaf",
-            uri="docs://leaf",
-            depth=0,
-            child_documents=["doc1", "doc2", "doc3"],
-            source_category="docs",
-        )
-
-        categories = {category.uri: category}
-
-        count = _count_documents_recursive(category, categories)
-        assert count == 3
-
-    def test_count_parent_category(self):
-        """Test counting documents including nested categories."""
-        parent = Category(
-            name="parent",
-            label="Parent",
-            uri="docs://parent",
-            depth=0,
-            child_documents=["doc1"],
-            child_categories=["docs://parent/child"],
-            source_category="docs",
-        )
-
-        child = Category(
-            name="child",
-            label="Child",
-            uri="docs://parent/child",
-            parent_uri="docs://parent",
-            depth=1,
-            child_documents=["doc2", "doc3"],
-            source_category="docs",
-        )
-
-        categories = {parent.uri: parent, child.uri: child}
-
-        count = _count_documents_recursive(parent, categories)
-        # Should count: doc1 + doc2 + doc3 = 3
-        assert count == 3
-
-    def test_count_empty_category(self):
-        """Test counting in category with no documents."""
-        category = Category(
-            name="empty",
-            label="Empty",
-            uri="docs://empty",
-            depth=0,
-            source_category="docs",
-        )
-
-        categories = {category.uri: category}
-
-        count = _count_documents_recursive(category, categories)
-        assert count == 0
-
-
 class TestGetRootContext:
     """Test root context generation."""
 
@@ -1,20 +1,32 @@
 """Unit tests for markdown parsing with YAML frontmatter."""
 
+import multiprocessing
+import sys
 from datetime import datetime
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
+import yaml
 
 from docs_mcp.core.models.document import Document
+from docs_mcp.core.services import markdown
+from docs_mcp.core.services.cache import get_cache
 from docs_mcp.core.services.markdown import (
+    _POOL_START_METHOD,
     MarkdownParseError,
     _extract_frontmatter,
     _extract_title,
     _generate_uri,
+    _parse_simple_frontmatter,
+    iter_markdown_files,
     parse_markdown_with_metadata,
     scan_markdown_files,
 )
 
+# File count standing in for a large tree once the parallel threshold is lowered to it
+_SMALL_TREE = 32
+
 
 @pytest.fixture
 def temp_docs(tmp_path):
@@ -116,6 +128,33 @@ Body"""
         assert frontmatter["metadata"]["author"] == "John Doe"
         assert isinstance(frontmatter["tags"], list)
 
+    @pytest.mark.parametrize(
+        "raw",
+        [
+            "title: Test Document\ntags: [test, documentation]\ncategory: guides\norder: 1",
+            "title: 'Quoted: yes'\ntags:\n  - a\n  - b\nparent:",
+            "tags:\n- api\n- auth\ndraft: no",
+            "order: 010\nversion: 1.5\ndate: 2024-01-01",
+            "title: Caf\u00e9 # comment\nmetadata:\n  author: John",
+            "tags: [a, [b]]\nYes: 1",
+        ],
+    )
+    def test_simple_frontmatter_fast_path_matches_yaml(self, raw):
+        """Test the fast path either defers to YAML or agrees with it exactly."""
+        parsed = _parse_simple_frontmatter(raw)
+        expected = yaml.safe_load(raw)
+
+        if parsed is not None:
+            assert parsed == expected
+            assert [type(v) for v in parsed.values()] == [type(v) for v in expected.values()]
+
+    def test_simple_frontmatter_defers_non_string_scalars(self):
+        """Test scalars YAML resolves to other types are left to the YAML loader."""
+        assert _parse_simple_frontmatter("title: Test\norder: 2") == {"title": "Test", "order": 2}
+        assert _parse_simple_frontmatter("draft: no") is None
+        assert _parse_simple_frontmatter("date: 2024-01-01") is None
+        assert _parse_simple_frontmatter("meta:\n  author: John") is None
+
     def test_frontmatter_non_dict_type(self):
         """Test handling of non-dict YAML result."""
         content = """---
@@ -314,6 +353,17 @@ Content here."""
         assert doc.tags == []
         assert doc.category is None
 
+    def test_parse_markdown_normalizes_crlf_newlines(self, temp_docs):
+        """Test Windows line endings are read as plain newlines."""
+        test_file = temp_docs / "guides" / "windows.md"
+        test_file.write_bytes(b"---\r\ntitle: Windows\r\n---\r\n\r\n# Heading\r\n\r\nBody\r\n")
+
+        doc = parse_markdown_with_metadata(test_file, temp_docs)
+
+        assert doc.title == "Windows"
+        assert "\r" not in doc.content
+        assert doc.size_bytes == test_file.stat().st_size
+
     def test_parse_markdown_with_malformed_frontmatter(self, temp_docs):
         """Test parsing markdown with malformed frontmatter."""
         test_file = temp_docs / "guides" / "malformed.md"
@@ -456,6 +506,21 @@ class TestScanMarkdownFiles:
         assert len(documents) == 1
         assert documents[0].file_path.suffix == ".md"
 
+    def test_scan_with_several_include_patterns(self, temp_docs):
+        """Test that a file matching any include pattern is scanned."""
+        (temp_docs / "test.md").write_text("# MD")
+        (temp_docs / "test.mdx").write_text("# MDX")
+        (temp_docs / "test.txt").write_text("# TXT")
+
+        documents = scan_markdown_files(
+            temp_docs, temp_docs, recursive=False, include_patterns=["*.md", "*.mdx"]
+        )
+        suffixes = sorted(doc.file_path.suffix for doc in documents)
+        assert suffixes == [".md", ".mdx"]
+
+        # No include patterns means nothing is scanned
+        assert scan_markdown_files(temp_docs, temp_docs, recursive=False, include_patterns=[]) == []
+
     def test_scan_with_exclude_patterns(self, temp_docs):
         """Test scanning with exclude patterns."""
         (temp_docs / "node_modules").mkdir()
@@ -532,6 +597,74 @@ class TestScanMarkdownFiles:
         assert any("guides/getting-started" in uri for uri in uris)
         assert any("guides/advanced/performance" in uri for uri in uris)
 
+    @pytest.fixture
+    def parallel_parsing(self, monkeypatch):
+        """Lower the parallel parse threshold and report two CPUs so a pool is used."""
+        monkeypatch.setattr(markdown, "_PARALLEL_PARSE_THRESHOLD", _SMALL_TREE)
+        monkeypatch.setattr(markdown.os, "cpu_count", lambda: 2)
+
+    def test_scan_large_directory_in_parallel(self, temp_docs, parallel_parsing):
+        """Test scanning enough files to parse them in parallel."""
+        count = _SMALL_TREE + 8
+        for i in range(count):
+            (temp_docs / f"doc{i:03d}.md").write_text(f"# Doc {i}")
+
+        documents = scan_markdown_files(temp_docs, temp_docs, recursive=False)
+
+        assert len(documents) == count
+        assert sorted(doc.title for doc in documents) == sorted(f"Doc {i}" for i in range(count))
+        assert get_cache().get(f"markdown:{documents[0].file_path}") is not None
+
+    def test_parallel_parse_avoids_fork_and_interns_keys(self, temp_docs, parallel_parsing):
+        """Test pool workers are not forked and their documents come back interned."""
+        count = _SMALL_TREE
+        for i in range(count):
+            (temp_docs / f"doc{i:03d}.md").write_text(f"---\ncategory: guides\n---\n# Doc {i}")
+
+        with patch(
+            "docs_mcp.core.services.markdown.get_context", wraps=multiprocessing.get_context
+        ) as mock_get_context:
+            documents = scan_markdown_files(temp_docs, temp_docs, recursive=False)
+
+        mock_get_context.assert_called_once_with(_POOL_START_METHOD)
+        assert _POOL_START_METHOD != "fork"
+        assert len(documents) == count
+        assert all(doc.uri is sys.intern(doc.uri) for doc in documents)
+        assert all(doc.category is sys.intern("guides") for doc in documents)
+
+    def test_parallel_parse_serial_on_single_cpu(self, temp_docs, parallel_parsing, monkeypatch):
+        """Test no pool is started when only one worker would run."""
+        monkeypatch.setattr(markdown.os, "cpu_count", lambda: 1)
+        for i in range(_SMALL_TREE):
+            (temp_docs / f"doc{i:03d}.md").write_text(f"# Doc {i}")
+
+        with patch("docs_mcp.core.services.markdown.ProcessPoolExecutor") as mock_pool:
+            documents = scan_markdown_files(temp_docs, temp_docs, recursive=False)
+
+        mock_pool.assert_not_called()
+        assert len(documents) == _SMALL_TREE
+
+    def test_parse_without_cache(self, temp_docs):
+        """Test parsing with use_cache=False neither reads nor fills the cache."""
+        file_path = temp_docs / "uncached.md"
+        file_path.write_text("# Uncached")
+
+        document = parse_markdown_with_metadata(file_path, temp_docs, use_cache=False)
+
+        assert document.title == "Uncached"
+        assert get_cache().get(f"markdown:{document.file_path}") is None
+
+    def test_iter_markdown_files_streams_documents(self, temp_docs):
+        """Test the generator yields parsed documents one at a time."""
+        (temp_docs / "first.md").write_text("# First")
+        (temp_docs / "second.md").write_text("# Second")
+
+        stream = iter_markdown_files(temp_docs, temp_docs, recursive=False)
+
+        first = next(stream)
+        assert isinstance(first, Document)
+        assert sorted([first.title, *(doc.title for doc in stream)]) == ["First", "Second"]
+
 
 class TestMarkdownEdgeCases:
     """Test edge cases in markdown parsing."""
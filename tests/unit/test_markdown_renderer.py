@@ -1,6 +1,6 @@
 """Unit tests for server-side markdown rendering."""
 
-from docs_mcp.web.markdown_renderer import render_markdown
+from docs_mcp.web.markdown_renderer import _render_cached, render_markdown
 
 
 class TestRenderMarkdown:
@@ -127,3 +127,16 @@ class TestRenderMarkdown:
         r2 = render_markdown("## Heading B")
         assert "Heading A" not in r2["html"]
         assert "Heading B" in r2["html"]
+
+    def test_repeat_renders_are_memoized(self):
+        """Test unchanged content is rendered once and results stay independent."""
+        content = "## Memoized Heading\n\nBody text."
+        first = render_markdown(content)
+        hits = _render_cached.cache_info().hits
+
+        second = render_markdown(content)
+
+        assert _render_cached.cache_info().hits == hits + 1
+        assert second == first
+        second["toc"][0]["name"] = "changed"
+        assert render_markdown(content)["toc"][0]["name"] == "Memoized Heading"
@@ -81,6 +81,12 @@ class TestSanitizeQuery:
         with pytest.raises(SanitizationError, match="suspicious pattern"):
             sanitize_query(query)
 
+    def test_first_listed_suspicious_pattern_reported(self):
+        """Test the reported pattern follows list order when several match."""
+        query = "`x` then eval(x)"
+        with pytest.raises(SanitizationError, match=r"eval\\s\*"):
+            sanitize_query(query)
+
     def test_excessive_length_blocked(self):
         """Test that queries exceeding max length are blocked."""
         query = "a" * (MAX_QUERY_LENGTH + 1)
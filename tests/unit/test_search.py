@@ -1,5 +1,6 @@
 """Unit tests for search functionality."""
 
+import re
 from datetime import datetime, timezone
 from unittest.mock import patch
 
@@ -7,15 +8,27 @@ import pytest
 
 from docs_mcp.core.models.document import Document
 from docs_mcp.core.models.navigation import Category
+from docs_mcp.core.services import search
 from docs_mcp.core.services.search import (
     SearchError,
-    _extract_excerpt,
+    _compiled_pattern,
+    _excerpt_around,
     _highlight_matches,
+    _metadata_index,
+    _MetadataIndex,
+    _search_index,
+    _SearchIndex,
     search_by_metadata,
     search_content,
 )
 
 
+@pytest.fixture
+def index_immediately(monkeypatch):
+    """Build the full-text index on the first search instead of after repeated scans."""
+    monkeypatch.setattr(search, "_SCANS_BEFORE_INDEXING", 0)
+
+
 class TestSearchContent:
     """Test search_content function."""
 
@@ -128,6 +141,18 @@ class TestSearchContent:
 
         assert len(results) == 1
 
+    def test_search_content_limit_keeps_best_results_in_order(
+        self, sample_documents, sample_categories
+    ):
+        """Test a limited search returns the highest-scoring results, best first."""
+        all_results = search_content("guide", sample_documents, sample_categories)
+        top_results = search_content("guide", sample_documents, sample_categories, limit=1)
+
+        scores = [r.relevance_score for r in all_results]
+        assert scores == sorted(scores, reverse=True)
+        assert top_results[0].relevance_score == scores[0]
+        assert top_results[0].document_uri == "docs://guides/getting-started"
+
     def test_search_content_with_category_filter(self, sample_documents, sample_categories):
         """Test search with category filter."""
         results = search_content(
@@ -137,6 +162,18 @@ class TestSearchContent:
         assert len(results) > 0
         assert all("guides" in r.document_uri for r in results)
 
+    def test_search_content_builds_results_only_for_top_hits(
+        self, sample_documents, sample_categories
+    ):
+        """Test results beyond the limit are scored but never materialized."""
+        with patch(
+            "docs_mcp.core.services.search._highlight_matches", wraps=_highlight_matches
+        ) as mock_highlight:
+            results = search_content("guide", sample_documents, sample_categories, limit=1)
+
+        assert len(results) == 1
+        assert mock_highlight.call_count == 1
+
     def test_search_content_empty_query(self, sample_documents, sample_categories):
         """Test search with empty query returns empty results."""
         results = search_content("", sample_documents, sample_categories)
@@ -170,6 +207,16 @@ class TestSearchContent:
             if doc.uri in [r.document_uri for r in results]
         )
 
+    def test_search_content_metadata_match_across_tag_and_category(
+        self, sample_documents, sample_categories
+    ):
+        """Test a query spanning the last tag and the category still finds its document."""
+        results = search_content("beginner guides", sample_documents, sample_categories)
+
+        assert [(r.document_uri, r.match_type) for r in results] == [
+            ("docs://guides/getting-started", "metadata")
+        ]
+
     def test_search_content_special_characters_escaped(self, sample_documents, sample_categories):
         """Test search handles regex special characters."""
         # This should not cause regex errors
@@ -185,6 +232,18 @@ class TestSearchContent:
             with pytest.raises(SearchError, match="Invalid search pattern"):
                 search_content("[", sample_documents, sample_categories)
 
+    def test_search_content_reuses_compiled_pattern(self, sample_documents, sample_categories):
+        """Test repeated queries reuse the memoized pattern instead of recompiling."""
+        _compiled_pattern.cache_clear()
+
+        # Different limits bypass the result cache but share the query pattern
+        search_content("authentication", sample_documents, sample_categories, limit=5)
+        search_content("authentication", sample_documents, sample_categories, limit=10)
+
+        info = _compiled_pattern.cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
+
     def test_search_content_breadcrumbs_included(self, sample_documents, sample_categories):
         """Test search results include breadcrumbs."""
         results = search_content("authentication", sample_documents, sample_categories)
@@ -202,6 +261,13 @@ class TestSearchContent:
             if result.relevance_score > 0:
                 assert result.excerpt != ""
 
+    def test_search_content_highlights_escaped_query(self, sample_documents, sample_categories):
+        """Test highlighting uses the same escaped pattern as matching."""
+        results = search_content("access.", sample_documents, sample_categories)
+
+        assert len(results) == 1
+        assert "**access.**" in results[0].highlighted_excerpt
+
     def test_search_content_multiple_matches(self, sample_documents, sample_categories):
         """Test search with multiple matching documents."""
         results = search_content("guide", sample_documents, sample_categories)
@@ -209,6 +275,156 @@ class TestSearchContent:
         # Should find multiple documents with "guide" in title or content
         assert len(results) >= 2
 
+    def test_search_content_score_saturates_on_many_matches(self):
+        """Test content score caps at ten matches and the excerpt uses the first one."""
+        content = "intro " * 50 + "needle " * 25
+        doc = Document(
+            file_path="/docs/many.md",
+            relative_path="many.md",
+            uri="docs://many",
+            title="Many",
+            content=content,
+            tags=[],
+            frontmatter={},
+            category=None,
+            last_modified=datetime.now(timezone.utc),
+            size_bytes=len(content),
+            parent=None,
+        )
+
+        results = search_content("needle", [doc], {})
+
+        assert results[0].relevance_score == pytest.approx(0.3)
+        assert results[0].excerpt.startswith("...")
+        assert "**needle**" in results[0].highlighted_excerpt
+
+    def test_search_content_matches_through_trigram_index(
+        self, sample_documents, sample_categories
+    ):
+        """Test case and escaped characters do not defeat the trigram index."""
+        results = search_content("JWT TOKENS.", sample_documents, sample_categories)
+
+        assert [r.document_uri for r in results] == []
+
+        results = search_content("JWT TOKENS", sample_documents, sample_categories)
+
+        assert [r.document_uri for r in results] == ["docs://api/authentication"]
+        assert "**JWT tokens**" in results[0].highlighted_excerpt
+
+    def test_search_index_candidates(self, sample_documents):
+        """Test the trigram index narrows candidates across title, tags and content."""
+        index = _SearchIndex(sample_documents)
+
+        assert [d.uri for d in index.candidates("JWT")] == ["docs://api/authentication"]
+        assert [d.uri for d in index.candidates("TUTORIAL")] == [
+            "docs://guides/getting-started",
+            "docs://guides/advanced",
+        ]
+        assert index.candidates("xyznonexistent") == []
+        # Queries shorter than a trigram cannot be narrowed
+        assert index.candidates("ap") is sample_documents
+
+    def test_search_index_candidates_within_uri_prefix(self, sample_documents):
+        """Test category prefixes narrow candidates before any content is scanned."""
+        index = _SearchIndex(sample_documents)
+
+        assert [d.uri for d in index.candidates("TUTORIAL", "docs://api")] == []
+        assert [d.uri for d in index.candidates("install", "docs://guides")] == [
+            "docs://guides/getting-started",
+        ]
+        assert [d.uri for d in index.candidates("ap", "docs://guides")] == [
+            "docs://guides/getting-started",
+            "docs://guides/advanced",
+        ]
+
+    def test_search_index_tag_bitsets(self, sample_documents):
+        """Test tag bitsets OR query tags and keep document order."""
+        index = _SearchIndex(sample_documents)
+
+        assert [d.uri for d in index.with_any_tag(["advanced", "security"])] == [
+            "docs://api/authentication",
+            "docs://guides/advanced",
+        ]
+        assert list(index.with_any_tag(["missing"])) == []
+
+    def test_search_index_metadata_bitsets(self, sample_documents):
+        """Test tag and category bitsets combine like the per-document filters."""
+        index = _SearchIndex(sample_documents)
+
+        assert [d.uri for d in index.with_metadata(["tutorial"], "guides")] == [
+            "docs://guides/getting-started",
+            "docs://guides/advanced",
+        ]
+        assert [d.uri for d in index.with_metadata(["tutorial", "api"], "api")] == [
+            "docs://api/authentication",
+        ]
+        assert [d.uri for d in index.with_metadata(None, "authentication")] == [
+            "docs://api/authentication",
+        ]
+        assert list(index.with_metadata([], None)) == sample_documents
+
+    def test_search_index_built_after_repeated_scans(self, sample_documents, monkeypatch):
+        """Test a list is scanned a few times before indexing it pays off."""
+        monkeypatch.setattr(search, "_SCANS_BEFORE_INDEXING", 2)
+
+        assert _search_index(sample_documents) is None
+        assert _search_index(sample_documents) is None
+        index = _search_index(sample_documents)
+
+        assert isinstance(index, _SearchIndex)
+        assert _search_index(sample_documents) is index
+
+    def test_search_index_candidates_match_turkish_i(self, sample_documents):
+        """Test dotless and dotted i match "i" in the index as they do case-insensitively."""
+        sample_documents[2].content = "Kullanım kılavuzu: İzmir ofisi"
+        index = _SearchIndex(sample_documents)
+
+        assert [d.uri for d in index.candidates("KULLANIM")] == ["docs://guides/advanced"]
+        assert [d.uri for d in index.candidates("izmir")] == ["docs://guides/advanced"]
+
+    def test_search_index_unnarrowed_when_folding_changes_length(self, sample_documents):
+        """Test a query whose folding changes its length is scanned against every document."""
+        index = _SearchIndex(sample_documents)
+
+        assert index.candidates("Straße") is sample_documents
+        assert [d.uri for d in index.candidates("Straße", "docs://api")] == [
+            "docs://api/authentication"
+        ]
+
+    def test_search_index_reused_until_documents_change(self, sample_documents, index_immediately):
+        """Test the index is rebuilt only when the searched list grows or is replaced."""
+        index = _search_index(sample_documents)
+
+        assert _search_index(sample_documents) is index
+
+        sample_documents.append(sample_documents[0].model_copy(update={"uri": "docs://copy"}))
+
+        assert _search_index(sample_documents) is not index
+
+    def test_search_index_rebuilt_when_document_replaced_in_place(
+        self, sample_documents, sample_categories, index_immediately
+    ):
+        """Test replacing a list item in place is not served from the stale index."""
+        _search_index(sample_documents)
+        sample_documents[1] = sample_documents[1].model_copy(
+            update={"content": "Rotate signing keys every quarter."}
+        )
+
+        results = search_content("signing keys", sample_documents, sample_categories)
+
+        assert [r.document_uri for r in results] == ["docs://api/authentication"]
+
+    def test_search_index_rebuilt_when_content_reassigned(
+        self, sample_documents, sample_categories, index_immediately
+    ):
+        """Test reassigning a document's content is not served from the stale index."""
+        _search_index(sample_documents)
+        sample_documents[0].content = "Mirror the repository before upgrading."
+
+        results = search_content("mirror the repository", sample_documents, sample_categories)
+
+        assert [r.document_uri for r in results] == ["docs://guides/getting-started"]
+
     def test_search_content_caching(self, sample_documents, sample_categories):
         """Test search results are cached."""
         # First search
@@ -359,67 +575,91 @@ class TestSearchByMetadata:
         for result in results:
             assert result.relevance_score == 1.0
 
+    def test_search_by_metadata_builds_no_trigram_postings(self, sample_documents):
+        """Test metadata search uses a metadata-only index when no full-text index is current."""
+        index = _metadata_index(sample_documents)
+
+        assert type(index) is _MetadataIndex
+        assert _metadata_index(sample_documents) is index
+
+        sample_documents[0].tags = ["renamed"]
+
+        assert _metadata_index(sample_documents) is not index
+        assert [
+            r.document_uri for r in search_by_metadata(["renamed"], None, sample_documents)
+        ] == ["docs://guides/getting-started"]
+
+    def test_search_by_metadata_reuses_current_search_index(
+        self, sample_documents, index_immediately
+    ):
+        """Test a current full-text index also serves metadata searches."""
+        index = _search_index(sample_documents)
 
-class TestExtractExcerpt:
-    """Test _extract_excerpt helper function."""
+        assert _metadata_index(sample_documents) is index
 
-    def test_extract_excerpt_with_match(self):
-        """Test extracting excerpt with query match."""
+
+class TestExcerptAround:
+    """Test _excerpt_around helper function."""
+
+    @staticmethod
+    def _span(content: str, term: str) -> tuple[int, int]:
+        """Return the span of term in content, as search_content's pattern would find it."""
+        start = content.index(term)
+        return start, start + len(term)
+
+    def test_excerpt_around_match(self):
+        """Test slicing an excerpt around a match."""
         content = "This is a long document with some interesting content about Python programming."
-        query = "interesting"
 
-        excerpt = _extract_excerpt(content, query, context_chars=20)
+        excerpt = _excerpt_around(content, self._span(content, "interesting"), context_chars=20)
 
         assert "interesting" in excerpt
         assert "..." in excerpt  # Should have ellipsis for truncation
 
-    def test_extract_excerpt_no_match(self):
-        """Test extracting excerpt when query doesn't match."""
+    def test_excerpt_around_no_match(self):
+        """Test the excerpt falls back to the start of the content without a match."""
         content = "This is a document without the search term."
-        query = "nonexistent"
 
-        excerpt = _extract_excerpt(content, query, context_chars=20)
+        excerpt = _excerpt_around(content, None, context_chars=20)
 
         assert len(excerpt) > 0
         assert excerpt.endswith("...")
 
-    def test_extract_excerpt_at_start(self):
-        """Test extracting excerpt when match is at start."""
+    def test_excerpt_around_match_at_start(self):
+        """Test slicing an excerpt when the match is at the start."""
         content = "Python is a great language for programming and data science."
-        query = "Python"
 
-        excerpt = _extract_excerpt(content, query, context_chars=20)
+        excerpt = _excerpt_around(content, self._span(content, "Python"), context_chars=20)
 
         assert excerpt.startswith("Python")
         assert excerpt.endswith("...")
 
-    def test_extract_excerpt_at_end(self):
-        """Test extracting excerpt when match is at end."""
+    def test_excerpt_around_match_at_end(self):
+        """Test slicing an excerpt when the match is at the end."""
         content = "This document is about programming in Python"
-        query = "Python"
 
-        excerpt = _extract_excerpt(content, query, context_chars=20)
+        excerpt = _excerpt_around(content, self._span(content, "Python"), context_chars=20)
 
         assert "Python" in excerpt
         assert excerpt.startswith("...")
 
-    def test_extract_excerpt_short_content(self):
-        """Test extracting excerpt from short content."""
+    def test_excerpt_around_short_content(self):
+        """Test slicing an excerpt from short content."""
         content = "Short text"
-        query = "text"
 
-        excerpt = _extract_excerpt(content, query, context_chars=20)
+        excerpt = _excerpt_around(content, self._span(content, "text"), context_chars=20)
 
-        assert "text" in excerpt
+        assert excerpt == "Short text"
 
-    def test_extract_excerpt_case_insensitive(self):
-        """Test extract excerpt is case-insensitive."""
-        content = "This document contains PYTHON programming examples."
-        query = "python"
+    def test_excerpt_around_pattern_match(self):
+        """Test slicing an excerpt around a span found by a compiled pattern."""
+        content = "Configure the v1.2 release before deploying."
+        match = re.compile(r"v1\.2", re.IGNORECASE).search(content)
 
-        excerpt = _extract_excerpt(content, query, context_chars=20)
+        excerpt = _excerpt_around(content, match.span(), context_chars=5)
 
-        assert "PYTHON" in excerpt
+        assert "v1.2" in excerpt
+        assert excerpt.startswith("...")
 
 
 class TestHighlightMatches:
@@ -479,6 +719,15 @@ class TestHighlightMatches:
         highlighted = _highlight_matches(text, query)
         assert isinstance(highlighted, str)
 
+    def test_highlight_matches_with_precompiled_pattern(self):
+        """Test highlighting with a pattern supplied by the caller."""
+        text = "Release v1.2 replaces v1x2"
+        pattern = re.compile(r"v1\.2", re.IGNORECASE)
+
+        highlighted = _highlight_matches(text, "ignored", pattern=pattern)
+
+        assert highlighted == "Release **v1.2** replaces v1x2"
+
 
 class TestSearchError:
     """Test SearchError exception."""
@@ -1,10 +1,12 @@
 """Unit tests for MCP server implementation."""
 
+import asyncio
 from unittest.mock import AsyncMock, patch
 
 import pytest
 
 from docs_mcp.core.config import ServerConfig
+from docs_mcp.core.services.markdown import iter_markdown_files
 from docs_mcp.mcp.server import DocumentationMCPServer, serve
 
 
@@ -50,7 +52,7 @@ class TestDocumentationMCPServer:
         config = ServerConfig(docs_root=str(docs_dir))
         server = DocumentationMCPServer(config)
 
-        await server.initialize()
+        await server.ensure_loaded()
 
         assert len(server.documents) > 0
         assert len(server.categories) > 0
@@ -64,12 +66,12 @@ class TestDocumentationMCPServer:
         config = ServerConfig(docs_root=str(docs_dir))
         server = DocumentationMCPServer(config)
 
-        # Mock scan_markdown_files to raise an exception
-        with patch("docs_mcp.mcp.server.scan_markdown_files") as mock_scan:
+        # Mock iter_markdown_files to raise an exception
+        with patch("docs_mcp.mcp.server.iter_markdown_files") as mock_scan:
             mock_scan.side_effect = Exception("Test error")
 
             # Should not raise, just log error
-            await server.initialize()
+            await server.ensure_loaded()
 
             # Documents should be empty since scan failed
             assert len(server.documents) == 0
@@ -85,10 +87,85 @@ class TestDocumentationMCPServer:
         config = ServerConfig(docs_root=str(docs_dir))
         server = DocumentationMCPServer(config)
 
-        await server.initialize()
+        await server.ensure_loaded()
 
         assert len(server.documents) > 0
 
+    @pytest.mark.asyncio
+    async def test_initialize_defers_loading(self, tmp_path):
+        """Test that initialize does not scan documentation."""
+        docs_dir = tmp_path / "docs"
+        docs_dir.mkdir()
+        (docs_dir / "doc1.md").write_text("# Doc 1")
+
+        config = ServerConfig(docs_root=str(docs_dir))
+        server = DocumentationMCPServer(config)
+
+        with patch("docs_mcp.mcp.server.iter_markdown_files") as mock_scan:
+            await server.initialize()
+
+            mock_scan.assert_not_called()
+        assert server.documents == []
+
+    @pytest.mark.asyncio
+    async def test_ensure_loaded_scans_once_under_concurrency(self, tmp_path):
+        """Test that concurrent first requests share a single load."""
+        docs_dir = tmp_path / "docs"
+        docs_dir.mkdir()
+        (docs_dir / "doc1.md").write_text("# Doc 1")
+
+        config = ServerConfig(docs_root=str(docs_dir))
+        server = DocumentationMCPServer(config)
+        await server.initialize()
+
+        with patch(
+            "docs_mcp.mcp.server.iter_markdown_files", wraps=iter_markdown_files
+        ) as mock_scan:
+            await asyncio.gather(server.ensure_loaded(), server.ensure_loaded())
+            await server.ensure_loaded()
+
+            assert mock_scan.call_count == len(config.sources)
+        assert len(server.documents) == 1
+
+    @pytest.mark.asyncio
+    async def test_first_tool_call_loads_documentation(self, tmp_path):
+        """Test that registered handlers load documentation on first use."""
+        from mcp.types import CallToolRequest, CallToolRequestParams
+
+        docs_dir = tmp_path / "docs"
+        guides_dir = docs_dir / "guides"
+        guides_dir.mkdir(parents=True)
+        (guides_dir / "test.md").write_text("# Test\n\nContent")
+
+        config = ServerConfig(docs_root=str(docs_dir))
+        server = DocumentationMCPServer(config)
+        await server.initialize()
+
+        handler = server.server.request_handlers[CallToolRequest]
+        await handler(
+            CallToolRequest(
+                method="tools/call",
+                params=CallToolRequestParams(name="get_table_of_contents", arguments={}),
+            )
+        )
+
+        assert len(server.documents) == 1
+        assert "docs://guides" in server.categories
+
+    @pytest.mark.asyncio
+    async def test_initialize_builds_uri_index(self, tmp_path):
+        """Test that initialize indexes loaded documents by URI."""
+        docs_dir = tmp_path / "docs"
+        docs_dir.mkdir()
+        (docs_dir / "doc1.md").write_text("# Doc 1\n\nContent 1")
+
+        config = ServerConfig(docs_root=str(docs_dir))
+        server = DocumentationMCPServer(config)
+
+        await server.ensure_loaded()
+
+        assert server.documents_by_uri == {doc.uri: doc for doc in server.documents}
+
     @pytest.mark.asyncio
     async def test_initialize_with_no_documents(self, tmp_path):
         """Test initialize with empty documentation directory."""
@@ -98,7 +175,7 @@ class TestDocumentationMCPServer:
         config = ServerConfig(docs_root=str(docs_dir))
         server = DocumentationMCPServer(config)
 
-        await server.initialize()
+        await server.ensure_loaded()
 
         assert server.documents == []
         assert server.categories == {}
@@ -114,7 +191,7 @@ class TestDocumentationMCPServer:
         config = ServerConfig(docs_root=str(docs_dir))
         server = DocumentationMCPServer(config)
 
-        await server.initialize()
+        await server.ensure_loaded()
 
         assert len(server.documents) == 2
 
@@ -130,7 +207,7 @@ class TestDocumentationMCPServer:
         # With allow_hidden=False (default)
         config = ServerConfig(docs_root=str(docs_dir), allow_hidden=False)
         server = DocumentationMCPServer(config)
-        await server.initialize()
+        await server.ensure_loaded()
 
         # Should not include hidden files
         hidden_docs = [d for d in server.documents if ".hidden" in str(d.file_path)]